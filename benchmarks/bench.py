@@ -0,0 +1,274 @@
+# Offline benchmarks for the data and rendering hot paths: Reports loading (Excel, JSON,
+# upload bytes, Arrow sidecar, in-memory column mapping), the register filter engine, the KPI
+# cube / group sums and the Submittals hierarchy + component payload. Inputs are synthetic
+# (synthetic.py, fixed seed) at 10k / 100k / 1M rows, written once under benchmarks/.data.
+#
+#   python benchmarks/bench.py --out bench.json                       # full run
+#   python benchmarks/bench.py --sizes 10k,100k --formats json,memory  # quick run
+#   python benchmarks/bench.py --out new.json --baseline bench.json --threshold 0.2
+#
+# Each case records the median and best wall time over --repeat runs (after one warm-up run),
+# the peak traced allocation of one extra run (tracemalloc: Python, numpy and pandas buffers;
+# Arrow's own pool is not included) and, where the case produces something for the browser,
+# its size in bytes. With --baseline, a case regresses when its best time, peak allocation or
+# payload grows by more than --threshold and by more than the noise floor (2 ms or the baseline
+# runs' spread; 1 MB); any regression makes the exit status 1. Baseline wall times are first
+# scaled by the ratio of the two reports' calibration times (a fixed sort + groupby), so a box
+# that is uniformly slower today does not read as a regression. Cases slower than 10 s (Excel
+# from 100k rows: openpyxl) run once, without the memory run; the 1M-row Excel input takes
+# several minutes to write and each read about as long.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import registers  # noqa: E402
+import reports_data  # noqa: E402
+import synthetic  # noqa: E402
+
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+SEED = 7
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+FORMATS = ("xlsx", "json", "memory")
+# Header names as a CloseoutSoft export spells them: every column goes through the alias
+# resolution in reports_data, plus two columns the loader has to drop.
+EXPORT_HEADERS = {
+    "Discipline": "Discipline Name", "System": "System Name", "Subsystem": "Sub-System",
+    "Status": "Submittal Status", "Activity": "Activity Type", "SubmittalDate": "Submitted On",
+    "InternalRefNumber": "Internal Ref Number", "Company": "Created Company Name",
+    "Building": "Building Name", "Level": "Floor", "Room": "Room Name",
+}
+SLOW_MS = 10_000  # cases slower than this run once and skip the tracemalloc run
+NOISE_MS = 2.0
+NOISE_MB = 1.0
+
+
+# -------------------- Inputs --------------------
+def export_frame(n: int) -> pd.DataFrame:
+    # Reports-shaped rows as a file would hold them: plain strings, export headers.
+    df = synthetic.reports_frame(np.random.default_rng(SEED), n)
+    out = {EXPORT_HEADERS[c]: (df[c].astype(object) if isinstance(df[c].dtype, pd.CategoricalDtype) else df[c])
+           for c in df.columns}
+    out["Room Name"] = pd.Series([None] * n, dtype=object)
+    out["Remarks"] = "synthetic"
+    out["Revision"] = np.arange(n) % 4
+    return pd.DataFrame(out)
+
+
+def input_file(fmt: str, n: int) -> Path:
+    path = DATA_DIR / f"reports_{n}.{fmt}"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        df, tmp = export_frame(n), path.with_name(path.name + ".tmp")
+        t = time.perf_counter()
+        if fmt == "json":
+            df.to_json(tmp, orient="records", date_format="iso")
+        else:
+            df.to_excel(tmp, index=False, engine="openpyxl")
+        os.replace(tmp, path)
+        print(f"  wrote {path.name} in {time.perf_counter() - t:.1f}s", file=sys.stderr)
+    return path
+
+
+# -------------------- Cases --------------------
+# A case is (name, setup, run): setup() builds the untimed inputs for one run and run(*args)
+# is the measured call. run returns the bytes it would send to the browser, or None.
+def loading_cases(fmt: str, n: int):
+    if fmt == "memory":
+        raw = export_frame(n)
+        yield "normalize", lambda: (raw.copy(),), lambda df: _none(reports_data.normalize_reports(df))
+        loaded = reports_data.normalize_reports(raw.copy())
+        side_src = DATA_DIR / f"memory_{n}"  # nominal source: the sidecar is only matched by size/mtime
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        reports_data.write_sidecar(side_src, loaded, 0, 0)
+        yield "read_sidecar", lambda: (), lambda: _none(reports_data.read_sidecar(side_src, 0, 0))
+        return
+    path = input_file(fmt, n)
+    yield f"read_{fmt}", lambda: (), lambda: _none(reports_data.normalize_reports(reports_data.read_reports_file(path)))
+    data = path.read_bytes()
+    yield f"upload_{fmt}", lambda: (), lambda: _none(reports_data.normalize_reports(reports_data.read_reports_bytes(path.name, data)))
+
+
+def register_cases(n: int):
+    regs = synthetic.build_registers(SEED, n)
+    mats = regs["materials"]
+    isin = {"Source": ["AG"], "Discipline": ["Civil", "Electrical"]}
+    dates = (pd.Timestamp("2025-02-15"), pd.Timestamp("2025-04-15"))
+    yield "filter_index", lambda: (), lambda: _none(registers.build_filter_index(mats))
+    index = registers.build_filter_index(mats)
+
+    def apply_filters():
+        rows = registers.select_rows(index, isin, dates)
+        return _none(mats if rows is None else mats.take(rows))
+    yield "apply_filters", lambda: (), apply_filters
+
+    yield "kpi_cube", lambda: (), lambda: _none(registers.build_kpi_cube(mats))
+    cubes = [registers.build_kpi_cube(regs[k]) for k in ("materials", "drawings", "ncrs", "ms")]
+    yield "kpi_totals", lambda: (), lambda: _none([registers.cube_totals(c, isin, dates) for c in cubes])
+    measures = ["Submitted", "Approved", "Rejected", "UR"]
+    yield "group_sums", lambda: (), lambda: _none(registers.build_group_sums(cubes[0], "Discipline", measures, isin, dates))
+
+
+def submittals_cases(n: int):
+    df = reports_data.normalize_reports(export_frame(n)).df
+    yield "hierarchy", lambda: (), lambda: _none(reports_data.prepare_hierarchy(df))
+    filled, _ = reports_data.prepare_hierarchy(df)
+    yield "submittals_payload", lambda: (), lambda: reports_data.encode_payload(reports_data.build_submittals_payload(filled))
+
+
+def _none(_result):
+    return None
+
+
+def payload_size(out) -> "int | None":
+    if out is None:
+        return None
+    return len(out) if isinstance(out, (bytes, bytearray)) else len(json.dumps(out).encode())
+
+
+def measure(setup, run, repeat: int, memory: bool) -> dict:
+    times, out = [], None
+    for _ in range(repeat + 1):
+        args = setup()
+        gc.collect()
+        t = time.perf_counter()
+        out = run(*args)
+        times.append((time.perf_counter() - t) * 1000)
+        if times[-1] > SLOW_MS:
+            break  # slow case: one run is enough
+    times = times[1:] if len(times) > 1 else times  # the first run warms caches up
+    result = {"wall_ms": round(statistics.median(times), 3), "wall_ms_min": round(min(times), 3),
+              "wall_ms_runs": [round(t, 3) for t in times], "payload_bytes": payload_size(out)}
+    if memory and times[-1] <= SLOW_MS:
+        args = setup()
+        gc.collect()
+        tracemalloc.start()
+        run(*args)
+        result["peak_alloc_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 3)
+        tracemalloc.stop()
+    return result
+
+
+def run_suite(sizes, formats, repeat: int, memory: bool, only=None) -> list:
+    results = []
+    for label in sizes:
+        n = SIZES[label]
+        groups = [loading_cases(fmt, n) for fmt in formats] + [register_cases(n), submittals_cases(n)]
+        for cases in groups:
+            for name, setup, run in cases:
+                if only and name not in only:
+                    continue
+                r = {"case": name, "rows": n, **measure(setup, run, repeat, memory)}
+                print(f"{name:<20} {label:>5} {r['wall_ms']:>11.1f} ms"
+                      + (f" {r['peak_alloc_mb']:>9.1f} MB" if r.get("peak_alloc_mb") is not None else "")
+                      + (f" {r['payload_bytes']:>11} B" if r["payload_bytes"] is not None else ""), file=sys.stderr)
+                results.append(r)
+    return results
+
+
+def calibrate(repeat: int = 7) -> float:
+    # Best-of time of a fixed numpy/pandas workload: the machine's speed for this run.
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"k": rng.integers(0, 1000, 2_000_000), "v": rng.random(2_000_000)})
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        np.sort(df["v"].to_numpy())
+        df.groupby("k")["v"].sum()
+        times.append((time.perf_counter() - t) * 1000)
+    return round(min(times), 3)
+
+
+def meta() -> dict:
+    try:
+        rev = subprocess.run(["git", "-C", str(ROOT), "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        rev = None
+    return {
+        "git": rev, "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+        "pandas": pd.__version__, "numpy": np.__version__, "calibration_ms": calibrate(),
+    }
+
+
+# -------------------- Baseline comparison --------------------
+# Wall time is compared on the best run: on a shared box the median still drifts by ~25%.
+METRICS = (("wall_ms_min", NOISE_MS), ("peak_alloc_mb", NOISE_MB), ("payload_bytes", 0))
+
+
+def compare(current: list, baseline: list, threshold: float, speed: float = 1.0) -> list:
+    # -> [(case, rows, metric, base, new, ratio)] for every metric that regressed; speed is
+    # current / baseline calibration time and scales the baseline's wall times.
+    base = {(r["case"], r["rows"]): r for r in baseline}
+    regressions = []
+    for r in current:
+        old = base.get((r["case"], r["rows"]))
+        if old is None:
+            continue
+        for metric, noise in METRICS:
+            a, b = old.get(metric), r.get(metric)
+            if a is None or b is None:
+                continue
+            if metric.startswith("wall_ms"):
+                # a difference within the baseline's run-to-run spread is noise
+                a = round(a * speed, 3)
+                noise = max(noise, (max(old["wall_ms_runs"]) - min(old["wall_ms_runs"])) * speed)
+            ratio = b / a if a else float("inf") if b else 1.0
+            if ratio > 1 + threshold and b - a > noise:
+                regressions.append((r["case"], r["rows"], metric, a, b, ratio))
+    return regressions
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmarks for the data and rendering hot paths.")
+    ap.add_argument("--sizes", default="10k,100k,1m", help="comma list of 10k, 100k, 1m")
+    ap.add_argument("--formats", default=",".join(FORMATS), help="comma list of xlsx, json, memory")
+    ap.add_argument("--cases", default="", help="comma list of case names to run (default: all)")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--baseline", help="results JSON to compare against")
+    ap.add_argument("--threshold", type=float, default=0.2, help="allowed growth, 0.2 = +20%%")
+    args = ap.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",") if s.strip()]
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    unknown = [s for s in sizes if s not in SIZES] + [f for f in formats if f not in FORMATS]
+    if unknown:
+        ap.error(f"unknown size/format: {', '.join(unknown)}")
+    only = {c.strip() for c in args.cases.split(",") if c.strip()} or None
+
+    report = {"meta": meta(), "results": run_suite(sizes, formats, max(1, args.repeat), not args.no_memory, only)}
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    base_cal, cal = baseline["meta"].get("calibration_ms"), report["meta"]["calibration_ms"]
+    speed = cal / base_cal if base_cal else 1.0
+    print(f"calibration {base_cal} -> {cal} ms: baseline wall times scaled x{speed:.2f}")
+    regressions = compare(report["results"], baseline["results"], args.threshold, speed)
+    for case, rows, metric, a, b, ratio in regressions:
+        print(f"REGRESSION {case}@{rows} {metric}: {a} -> {b} (x{ratio:.2f})")
+    print(f"{len(regressions)} regression(s) vs {args.baseline} (threshold +{args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
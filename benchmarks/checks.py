@@ -0,0 +1,231 @@
+# Correctness checks for the fast paths, against the plain pandas / json code they replace:
+# synthetic data (synthetic.py, fixed seed) plus hand-made edge cases. No test framework:
+# each check returns a list of mismatches, and any mismatch makes the exit status 1.
+#
+#   python benchmarks/checks.py                  # all checks
+#   python benchmarks/checks.py filters_and_cube  # some of them
+
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import registers  # noqa: E402
+import reports_data  # noqa: E402
+import synthetic  # noqa: E402
+
+SEED = 7
+CHECKS = {}
+
+
+def check(fn):
+    CHECKS[fn.__name__] = fn
+    return fn
+
+
+# -------------------- Register filters and KPI cube --------------------
+def _reference_rows(df: pd.DataFrame, isin: dict, date_range) -> np.ndarray:
+    # The filter written out in pandas: isin per column, day-inclusive Date range.
+    m = pd.Series(True, index=df.index)
+    for col, values in isin.items():
+        if col in df.columns:
+            m &= df[col].isin(values)
+    if date_range is not None and "Date" in df.columns:
+        day = df["Date"].dt.floor("D")
+        m &= (day >= pd.Timestamp(date_range[0]).floor("D")) & (day <= pd.Timestamp(date_range[1]).floor("D"))
+    return np.flatnonzero(m.to_numpy())
+
+
+def _timed_frame(rng, n: int) -> pd.DataFrame:
+    # A register whose Dates carry a time of day, some missing Dates and Disciplines.
+    df = synthetic.materials(rng, n)
+    df["Date"] = df["Date"] + pd.to_timedelta(rng.integers(0, 24 * 60, n), unit="min")
+    df.loc[rng.random(n) < 0.02, "Date"] = pd.NaT
+    df.loc[rng.random(n) < 0.02, "Discipline"] = np.nan
+    return df
+
+
+@check
+def filters_and_cube() -> list:
+    rng = np.random.default_rng(SEED)
+    frames = {name: df for name, df in synthetic.build_registers(SEED, 2000).items()}
+    frames["timed"] = _timed_frame(rng, 2000)
+    # Two rows on one day, midnight and 14:00, and a one-day range: both paths must count both.
+    frames["same_day"] = pd.DataFrame({
+        "Date": pd.to_datetime(["2025-03-01 00:00", "2025-03-01 14:00", "2025-03-02 09:00"]),
+        "Discipline": pd.Categorical(["Civil", "Civil", "ELV"]),
+        "Source": pd.Categorical(["AG", "AG", "AG"]),
+        "Submitted": [1, 10, 100],
+    })
+    cases = [
+        ({}, None),
+        ({"Source": ["AG"]}, None),
+        ({"Source": ["AG", "CloseoutSoft"], "Discipline": synthetic.DISCIPLINES}, None),
+        ({"Discipline": ["Civil", "Electrical"]}, ("2025-02-15", "2025-04-15")),
+        ({"Source": ["CloseoutSoft"]}, ("2025-03-01", "2025-03-01")),
+        ({}, ("2025-03-01 12:00", "2025-03-02 06:00")),  # bounds with a time: whole days
+        ({"Discipline": []}, None),
+        ({}, ("2020-01-01", "2030-01-01")),
+    ]
+    problems = []
+    for name, df in frames.items():
+        index = registers.build_filter_index(df)
+        cube = registers.build_kpi_cube(df)
+        measures = [m for m in registers.CUBE_MEASURES if m in df.columns]
+        for isin, date_range in cases:
+            where = f"{name} {isin} {date_range}"
+            ref = _reference_rows(df, isin, date_range)
+            rows = registers.select_rows(index, isin, date_range)
+            got = np.arange(len(df)) if rows is None else rows
+            if not np.array_equal(got, ref):
+                problems.append(f"select_rows {where}: {len(got)} rows, expected {len(ref)}")
+            expected = {m: int(df[m].iloc[ref].sum()) for m in measures}
+            totals = registers.cube_totals(cube, isin, date_range)
+            if totals["Rows"] != len(ref) or any(totals[m] != v for m, v in expected.items()):
+                problems.append(f"cube_totals {where}: {totals}, expected {expected} over {len(ref)} rows")
+            if "Discipline" in df.columns and measures:
+                sums = registers.build_group_sums(cube, "Discipline", measures, isin, date_range).wide
+                ref_sums = df.iloc[ref].groupby("Discipline", observed=True)[measures].sum().reset_index()
+                if (sums["Discipline"].astype(str).tolist() != ref_sums["Discipline"].astype(str).tolist()
+                        or not np.array_equal(sums[measures].to_numpy(), ref_sums[measures].to_numpy())):
+                    problems.append(f"group_sums {where}: differs from a groupby of the filtered rows")
+    return problems
+
+
+# -------------------- Streaming JSON reader --------------------
+# The pull reader (reports_data._read_json_streaming) only runs on exports of 32 MB and up;
+# here it runs on small documents with a read window down to 1 char and chunks down to 1
+# row, so window-edge refills, numbers cut at the window edge, the top-level object vs list
+# forms and chunk flushes with keys first seen mid-chunk are all exercised against json.load.
+READ_CHARS = (1, 3, 7, 64, 1 << 20)
+CHUNK_ROWS = (1, 4, 50_000)
+NO_RECORD_ARRAY = {"object_without_list", "list_of_scalars"}  # read_reports_file falls back to eager
+
+
+def _json_documents() -> dict:
+    import bench
+
+    records = json.loads(bench.export_frame(60).to_json(orient="records", date_format="iso"))
+    ragged = [dict(r) for r in records[:23]]
+    for i, r in enumerate(ragged):
+        if i >= 6:
+            r["Late Column"] = i * 1.5      # a key first seen mid-chunk
+        if i % 5 == 0:
+            r.pop("Building Name")          # a key missing from some records
+        if i % 3 == 0:
+            ragged[i] = dict(reversed(list(r.items())))  # another key order
+    ragged[2]["Discipline Name"] = 'Fa\u00e7ade "A" \\ {x}, [y]'
+    return {
+        "list": json.dumps(records),
+        "list_pretty": json.dumps(records, indent=2),
+        "object": json.dumps({"meta": {"rows": [1, 2], "n": 60}, "count": -123456.5e-3, "name": "x",
+                              "Reports": records, "tail": [1]}, separators=(",", ":")),
+        "ragged": json.dumps(ragged),
+        "numbers_at_edges": json.dumps([{"Discipline": "D", "System": f"S{i}", "Revision": 10 ** (i % 12),
+                                         "Score": -1.25e-7 * i} for i in range(40)], separators=(",", ":")),
+        "empty_list": "[]",
+        "empty_in_object": ' { "a" : 1 , "rows" : [ ] } ',
+        "object_without_list": '{"Discipline": "D", "System": "S"}',
+        "list_of_scalars": "[1, 2, 3]",
+    }
+
+
+def _read(path: Path, data: bytes, stream: bool, read_chars: int, chunk_rows: int) -> dict:
+    # The public loaders, plus the pull reader on its own: read_reports_file falls back to the
+    # eager path on _NoRecordArray, which would hide a reader that gives up half way.
+    saved = reports_data.JSON_STREAM_MIN_BYTES, reports_data.JSON_READ_CHARS, reports_data.JSON_CHUNK_ROWS
+    reports_data.JSON_STREAM_MIN_BYTES = 0 if stream else 1 << 62
+    reports_data.JSON_READ_CHARS, reports_data.JSON_CHUNK_ROWS = read_chars, chunk_rows
+    try:
+        out = {"file": reports_data.read_reports_file(path), "bytes": reports_data.read_reports_bytes(path.name, data)}
+        if stream and path.stem not in NO_RECORD_ARRAY:
+            with open(path, encoding="utf-8") as f:
+                try:
+                    out["stream"] = reports_data._read_json_streaming(f)
+                except reports_data._NoRecordArray:
+                    out["stream"] = None
+        return out
+    finally:
+        reports_data.JSON_STREAM_MIN_BYTES, reports_data.JSON_READ_CHARS, reports_data.JSON_CHUNK_ROWS = saved
+
+
+def _same_frame(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    # Missing keys: the stream back-fills None, json.load + DataFrame gives NaN; same thing here.
+    a, b = (f.astype(object).where(f.notna(), None) for f in (a, b))
+    try:
+        pd.testing.assert_frame_equal(a, b, check_dtype=False)
+        return True
+    except AssertionError:
+        return False
+
+
+@check
+def json_streaming() -> list:
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in _json_documents().items():
+            path, data = Path(tmp) / f"{name}.json", text.encode()
+            path.write_bytes(data)
+            eager = _read(path, data, False, 1 << 20, 50_000)
+            eager_file = eager["file"]
+            if not _same_frame(eager_file, eager["bytes"]):
+                problems.append(f"{name}: eager file and bytes reads differ")
+            for read_chars in READ_CHARS:
+                for chunk_rows in CHUNK_ROWS:
+                    got = _read(path, data, True, read_chars, chunk_rows)
+                    got_file = got["file"]
+                    if got.get("stream", False) is None:
+                        problems.append(f"{name} (window {read_chars}, chunk {chunk_rows}): "
+                                        "pull reader raised _NoRecordArray")
+                    for how, got in got.items():
+                        if got is not None and not _same_frame(got, eager_file):
+                            problems.append(f"{name} ({how}, window {read_chars}, chunk {chunk_rows}): "
+                                            f"{got.shape} differs from json.load {eager_file.shape}")
+                    eager_norm, got_norm = (reports_data.normalize_reports(f).df for f in (eager_file, got_file))
+                    if (eager_norm is None) != (got_norm is None) or (
+                            eager_norm is not None and not _same_frame(got_norm, eager_norm)):
+                        problems.append(f"{name} (window {read_chars}, chunk {chunk_rows}): normalized frames differ")
+    # Documents without a record array fall back to the eager path instead of failing.
+    for text in ('{"Discipline": "D", "System": "S"}', "[1, 2, 3]", '"text"'):
+        try:
+            reports_data._read_json_streaming(io.StringIO(text))
+            problems.append(f"{text!r}: expected _NoRecordArray")
+        except reports_data._NoRecordArray:
+            pass
+    # Truncated documents must fail, not return a partial frame.
+    for text in ('[{"a": 1}, {"a": 2}', '[{"a": 1} {"a": 2}]', '{"rows": [{"a": 1}, {"a": 1'):
+        try:
+            reports_data._read_json_streaming(io.StringIO(text))
+            problems.append(f"{text!r}: malformed JSON read without an error")
+        except reports_data._NoRecordArray:
+            problems.append(f"{text!r}: malformed JSON treated as 'no record array'")
+        except ValueError:
+            pass
+    return problems
+
+
+def main(argv=None) -> int:
+    names = (argv if argv is not None else sys.argv[1:]) or list(CHECKS)
+    unknown = [n for n in names if n not in CHECKS]
+    if unknown:
+        print(f"unknown check(s): {', '.join(unknown)}; have {', '.join(CHECKS)}", file=sys.stderr)
+        return 2
+    failed = 0
+    for name in names:
+        problems = CHECKS[name]()
+        print(f"{name:<24} {'ok' if not problems else f'{len(problems)} mismatch(es)'}")
+        for p in problems[:20]:
+            print(f"  {p}")
+        failed += bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
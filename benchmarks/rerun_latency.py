@@ -0,0 +1,204 @@
+# End-to-end rerun latency: replays scripted user interactions against streamlit_app.py with
+# streamlit.testing.v1.AppTest (headless, in-process) and reports p50 / p95 of the full script
+# run behind each one. The Submittals tab reads a synthetic Reports export (bench.py's inputs,
+# under benchmarks/.data) through REPORTS_FILE; DEMO_SCALE optionally scales the registers.
+#
+#   python benchmarks/rerun_latency.py                                # 1 session, 100k-row JSON
+#   python benchmarks/rerun_latency.py --sessions 4 --repeat 10       # 4 concurrent sessions
+#   python benchmarks/rerun_latency.py --rows 1m --scale 1e6 --out latency.json
+#
+# Each session is its own AppTest (own session state) on its own thread; process-wide caches
+# (cache_resource, the Reports loader) are shared, as they are between browser sessions, so
+# --sessions > 1 shows lock and GIL contention. A session loads the app once ("first_load";
+# the first session's also pays imports and cache builds), then runs the interaction cycle
+# --repeat times. AppTest always runs the whole script: Submittals widgets that a browser
+# reruns as a fragment are timed here as full reruns, an upper bound.
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+from streamlit.testing.v1.util import patch_config_options
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))  # AppTest does not put the app's folder on sys.path
+APP = ROOT / "streamlit_app.py"
+DATA_DIR = Path(__file__).resolve().parent / ".data"  # bench.py's input files
+ROWS = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+# -------------------- Interactions --------------------
+# (name, action): action(at) changes one widget on the AppTest; the rerun it triggers is timed.
+# The cycle ends where it started (Overview, every filter at All), so passes are comparable.
+def _option(at, key: str, i: int):
+    return at.selectbox(key=key).options[i]
+
+
+INTERACTIONS = [
+    ("source", lambda at: at.selectbox(key="src_all").select("AG")),
+    ("discipline", lambda at: at.multiselect(key="disc_all_raw").set_value(["Civil"])),
+    ("tab_submittals", lambda at: at.radio(key="active_tab").set_value("Submittals")),
+    ("activity", lambda at: at.selectbox(key="activity_select").select("WIR")),
+    ("cascade_discipline", lambda at: at.selectbox(key="subm_disc").set_value(_option(at, "subm_disc", 1))),
+    ("cascade_system", lambda at: at.selectbox(key="subm_sys").set_value(_option(at, "subm_sys", 1))),
+    ("cascade_subsystem", lambda at: at.selectbox(key="subm_sub").set_value(_option(at, "subm_sub", 1))),
+    ("clear", lambda at: at.button(key="subm_clear_top").click()),
+    ("activity_all", lambda at: at.selectbox(key="activity_select").select("(All)")),
+    ("tab_overview", lambda at: at.radio(key="active_tab").set_value("Overview")),
+    ("discipline_all", lambda at: at.multiselect(key="disc_all_raw").set_value(["All"])),
+    ("source_all", lambda at: at.selectbox(key="src_all").select("All")),
+]
+
+
+# -------------------- Sessions --------------------
+_script_cache = ScriptCache()
+
+
+class SessionAppTest(AppTest):
+    # AppTest._run installs a mock Runtime for each run and clears the global afterwards, which
+    # breaks every other session's run in flight. Here all sessions share the one installed by
+    # shared_runtime(), and a run only executes the script. The compiled script is shared too,
+    # as on a server (AppTest recompiles per run, and concurrent compiles can fail on 3.11).
+    def _run(self, widget_state=None, timeout=None):
+        runner = LocalScriptRunner(self._script_path, self.session_state,
+                                   PagesManager(self._script_path, setup_watcher=False),
+                                   args=self.args, kwargs=self.kwargs)
+        runner._script_cache = _script_cache
+        timeout = self.default_timeout if timeout is None else timeout
+        self._tree = runner.run(widget_state, self.query_params, timeout, self._page_hash)
+        self._tree._runner = self
+        return self
+
+
+@contextlib.contextmanager
+def shared_runtime():
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    try:
+        with patch_config_options({"global.appTest": True}):
+            yield
+    finally:
+        Runtime._instance = None
+
+
+def _timed_run(at, timeout: float) -> float:
+    t = time.perf_counter()
+    at.run(timeout=timeout)
+    ms = (time.perf_counter() - t) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return ms
+
+
+def session(repeat: int, timeout: float, only, samples: dict, lock: threading.Lock) -> None:
+    at = SessionAppTest(str(APP), default_timeout=timeout)
+    times = [("first_load", _timed_run(at, timeout))]
+    for _ in range(repeat):
+        for name, action in INTERACTIONS:
+            action(at)
+            ms = _timed_run(at, timeout)
+            if not only or name in only:
+                times.append((name, ms))
+    with lock:
+        for name, ms in times:
+            samples.setdefault(name, []).append(ms)
+
+
+def run_sessions(n: int, repeat: int, timeout: float, only=None) -> "tuple[dict, list]":
+    samples, errors, lock = {}, [], threading.Lock()
+
+    def target():
+        try:
+            session(repeat, timeout, only, samples, lock)
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=target, name=f"session-{i}") for i in range(n)]
+    with shared_runtime():
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    return samples, errors
+
+
+def summarize(samples: dict) -> list:
+    order = ["first_load"] + [name for name, _ in INTERACTIONS]
+    out = []
+    for name in sorted(samples, key=order.index):
+        v = np.asarray(samples[name])
+        out.append({"interaction": name, "n": len(v), "p50_ms": round(float(np.percentile(v, 50)), 1),
+                    "p95_ms": round(float(np.percentile(v, 95)), 1), "max_ms": round(float(v.max()), 1)})
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Rerun latency per interaction, via AppTest.")
+    ap.add_argument("--sessions", type=int, default=1, help="concurrent sessions (threads)")
+    ap.add_argument("--repeat", type=int, default=5, help="interaction cycles per session")
+    ap.add_argument("--rows", default="100k", choices=list(ROWS), help="synthetic Reports rows")
+    ap.add_argument("--format", default="json", choices=["json", "xlsx"], help="synthetic Reports file format")
+    ap.add_argument("--scale", help="DEMO_SCALE for the registers (default: demo sizes)")
+    ap.add_argument("--interactions", default="", help="comma list of interactions to report (default: all)")
+    ap.add_argument("--timeout", type=float, default=120.0, help="seconds per script run")
+    ap.add_argument("--out", help="write results JSON here")
+    args = ap.parse_args(argv)
+    only = {s.strip() for s in args.interactions.split(",") if s.strip()} or None
+    unknown = (only or set()) - {name for name, _ in INTERACTIONS}
+    if unknown:
+        ap.error(f"unknown interaction: {', '.join(sorted(unknown))}")
+
+    # Set before bench imports reports_data / synthetic: both read them at import time.
+    reports = DATA_DIR / f"reports_{ROWS[args.rows]}.{args.format}"
+    os.environ["REPORTS_FILE"] = str(reports)
+    if args.scale:
+        os.environ["DEMO_SCALE"] = args.scale
+    import bench
+
+    bench.input_file(args.format, ROWS[args.rows])  # written once, like bench.py's inputs
+
+    # session threads touch session state outside a script run; the warning is expected
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    t = time.perf_counter()
+    samples, errors = run_sessions(max(1, args.sessions), max(1, args.repeat), args.timeout, only)
+    wall = time.perf_counter() - t
+    for e in errors:
+        print(f"session failed: {e}", file=sys.stderr)
+
+    rows = summarize(samples)
+    print(f"{'interaction':<20} {'n':>4} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for r in rows:
+        print(f"{r['interaction']:<20} {r['n']:>4} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['max_ms']:>9.1f}")
+    print(f"{args.sessions} session(s) x {args.repeat} cycle(s) in {wall:.1f}s, Reports: {reports.name}"
+          + (f", DEMO_SCALE={args.scale}" if args.scale else ""))
+    if args.out:
+        report = {
+            "meta": {**bench.meta(), "sessions": args.sessions, "repeat": args.repeat, "reports": reports.name,
+                     "demo_scale": args.scale, "wall_s": round(wall, 1), "errors": errors},
+            "results": rows,
+            "samples_ms": {k: [round(x, 1) for x in v] for k, v in samples.items()},
+        }
+        Path(args.out).write_text(json.dumps(report, indent=2))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# Plotly Express defaults, brand colors and figure styling for the chart tabs. Imported by the
+# tab functions on first use, so plotly.express loads only when a chart tab renders.
+
+import plotly.express as px
+
+# Plotly defaults
+px.defaults.template = None
+px.defaults.color_discrete_sequence = px.colors.qualitative.Pastel
+
+# Brand accents & colors
+STATUS_COLORS = {
+    "Approved": "#A3E4D7",
+    "ApprovedWithComments": "#C9E4FF",
+    "Rejected": "#FADBD8",
+    "UR": "#FDEBD0",
+    "Open": "#F9E79F",
+    "Closed": "#D7BDE2",
+}
+SOURCE_COLORS = {"AG": "#AED6F1", "CloseoutSoft": "#F5CBA7"}
+
+
+# ---------- Styling helpers ----------
+def style_fig(fig, *, height=220, showlegend=True, legend_title=" "):
+    fig.update_layout(
+        title=None,
+        legend_title_text="",
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        height=height,
+        font=dict(color="#0F172A", size=12),
+        title_font=dict(color="#0B1220", size=15),
+        legend=dict(
+            font=dict(size=10),
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            x=0,
+        ),
+        margin=dict(l=8, r=8, t=32, b=6),
+        showlegend=showlegend,
+    )
+    fig.update_xaxes(
+        showgrid=False,
+        tickfont=dict(size=11, color="#0F172A"),
+        title_font=dict(size=12, color="#0F172A"),
+        showline=True, linewidth=1, linecolor="#CBD5E1", zeroline=False,
+    )
+    fig.update_yaxes(
+        gridcolor="#EEF2F7",
+        tickfont=dict(size=11, color="#0F172A"),
+        title_font=dict(size=12, color="#0F172A"),
+        showline=True, linewidth=1, linecolor="#CBD5E1", zeroline=False,
+    )
+    return fig
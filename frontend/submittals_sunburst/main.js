@@ -0,0 +1,266 @@
+// Submittals sunburst + windowed detail table (Streamlit component, no build step).
+// Speaks the component postMessage protocol directly: componentReady -> render(args) ->
+// setComponentValue / setFrameHeight. See submittals_component.py for the args contract.
+(function () {
+  "use strict";
+  const DELIM = "|||", ROOT = "ROOT";
+  const ROW_H = 34, OVERSCAN = 12;  // detail table: fixed row height (px), rows kept beyond the viewport
+
+  const cascadeEl = document.getElementById("cascade");
+  const chartEl = document.getElementById("chart");
+  const badgeEl = document.getElementById("badge");
+  const metaEl = document.getElementById("meta");
+  const thead = document.getElementById("thead");
+  const tbody = document.getElementById("tbody");
+  const scrollEl = document.getElementById("scroll");
+
+  // ---- Streamlit protocol ----
+  function send(type, data) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+  }
+  function setValue(value) { send("streamlit:setComponentValue", { value: value, dataType: "json" }); }
+  let frameHeight = -1;
+  function fitFrame() {
+    const h = document.documentElement.scrollHeight;
+    if (h !== frameHeight) { frameHeight = h; send("streamlit:setFrameHeight", { height: h }); }
+  }
+
+  // ---- Loading ----
+  let plotlyReady = null;
+  // Streamlit's component route sends "Cache-Control: public" with no max-age or validator,
+  // so a plain <script src> refetches the ~3.5 MB bundle on every iframe mount. The URL is
+  // versioned (?v=<plotly version>), so the bundle is kept in Cache Storage and loaded from a
+  // blob URL; without Cache Storage (plain http off localhost) it falls back to the URL.
+  async function cachedScriptUrl(src) {
+    if (!window.caches) return src;
+    try {
+      const url = new URL(src, location.href).href;
+      const cache = await caches.open("submittals-sunburst");
+      let resp = await cache.match(url);
+      if (!resp) {
+        resp = await fetch(url);
+        if (!resp.ok) return src;
+        await cache.put(url, resp.clone());
+        for (const req of await cache.keys()) if (req.url !== url) cache.delete(req);  // older versions
+      }
+      return URL.createObjectURL(await resp.blob());
+    } catch (e) {
+      return src;
+    }
+  }
+  function loadPlotly(src) {
+    if (window.Plotly) return Promise.resolve();
+    if (!plotlyReady) {
+      plotlyReady = cachedScriptUrl(src).then(url => new Promise((resolve, reject) => {
+        const s = document.createElement("script");
+        s.src = url; s.onload = resolve; s.onerror = reject;
+        document.head.appendChild(s);
+      }));
+    }
+    return plotlyReady;
+  }
+  async function decodePayload(payload) {
+    if (!(payload instanceof Uint8Array || payload instanceof ArrayBuffer)) return payload;  // plain JSON arg
+    const stream = new Blob([payload]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return JSON.parse(await new Response(stream).text());
+  }
+
+  // ---- Data (one loaded payload at a time) ----
+  let D = null;  // unpacked payload, see unpack()
+  let requested = null;  // version we asked Python to resend
+
+  function unpack(version, P) {
+    // Sunburst arrays: ids are rebuilt from parent positions + label codes
+    const N = P.nodes, n = N.value.length;
+    const ids = new Array(n), labels = new Array(n), parents = new Array(n), depth = new Array(n), path = new Array(n);
+    for (let i = 0; i < n; i++) {
+      const lab = N.labels[N.label[i]], p = N.parent[i];
+      labels[i] = lab;
+      if (p < 0) { ids[i] = ROOT; parents[i] = ""; depth[i] = 0; path[i] = []; }
+      else {
+        ids[i] = (p === 0 ? lab : ids[p] + DELIM + lab); parents[i] = ids[p];
+        depth[i] = depth[p] + 1; path[i] = path[p].concat([lab]);
+      }
+    }
+    return {
+      version: version, ids: ids, labels: labels, parents: parents, depth: depth, path: path,
+      values: N.value, parent: N.parent,
+      pos: new Map(ids.map((k, i) => [k, i])),
+      levels: P.levels || [],
+      // Detail rows: one string table + code array per column
+      cols: P.rows.columns,
+      all: Array.from({ length: P.rows.n }, (_, i) => i),
+      // Node -> rows: a node's rows are one contiguous slice of its depth's path-sorted order
+      orders: P.index.orders.map(o => Int32Array.from(o)),
+      index: P.index,
+    };
+  }
+  function slice(i) {
+    const s = D.index.start[i];
+    return D.orders[D.depth[i] - 1].subarray(s, s + D.index.length[i]);
+  }
+
+  // ---- In-component cascade (Discipline / System / Subsystem), all in the browser ----
+  // sel[k] is the chosen label at level k (null = "(All)"). The view keeps the nodes on
+  // selected paths and re-totals the levels above the deepest selection, which gives the
+  // same tree the server builds from the filtered rows.
+  let sel = [], opts = [], cascadeOn = false, reportClicks = true, lastReset = null;
+  let V = null;  // current view
+
+  function consistent(i, upto) {
+    const p = D.path[i];
+    for (let k = 0; k < Math.min(p.length, upto); k++) if (sel[k] != null && p[k] !== sel[k]) return false;
+    return true;
+  }
+  function buildView() {
+    let m = 0;
+    sel.forEach((v, k) => { if (v != null) m = k + 1; });
+    if (m === 0) return { ids: D.ids, labels: D.labels, parents: D.parents, values: D.values, m: 0, value: D.values, under: null };
+    const n = D.ids.length, value = new Array(n).fill(0), keep = new Uint8Array(n), under = new Map();
+    keep[0] = 1;
+    for (let i = 1; i < n; i++) {
+      if (D.depth[i] < m || !consistent(i, m)) continue;
+      keep[i] = 1; value[i] = D.values[i];
+      if (D.depth[i] !== m) continue;
+      for (let a = D.parent[i]; a >= 0; a = D.parent[a]) {
+        keep[a] = 1; value[a] += D.values[i];
+        if (!under.has(a)) under.set(a, []);
+        under.get(a).push(i);
+      }
+    }
+    const idx = [];
+    for (let i = 0; i < n; i++) if (keep[i]) idx.push(i);
+    return {
+      ids: idx.map(i => D.ids[i]), labels: idx.map(i => D.labels[i]), parents: idx.map(i => D.parents[i]),
+      values: idx.map(i => value[i]), m: m, value: value, under: under,
+    };
+  }
+  function rowsOf(i) {
+    if (V.m === 0 || D.depth[i] >= V.m) return i === 0 ? D.all : slice(i);
+    // above the deepest selection: the selected descendants' rows, back in page order
+    const parts = (V.under.get(i) || []).map(slice);
+    if (parts.length === 1) return parts[0];
+    const out = new Int32Array(parts.reduce((t, p) => t + p.length, 0));
+    let o = 0;
+    for (const p of parts) { out.set(p, o); o += p.length; }
+    return out.sort();
+  }
+  function optionsFor(k) {
+    const present = new Set();
+    for (let i = 1; i < D.ids.length; i++) if (D.depth[i] === k + 1 && consistent(i, k)) present.add(D.path[i][k]);
+    return D.levels[k].labels.filter(l => present.has(l));
+  }
+  function buildCascade() {
+    opts = D.levels.map(() => []);
+    D.levels.forEach((lvl, k) => {
+      opts[k] = optionsFor(k);
+      if (sel[k] != null && !opts[k].includes(sel[k])) sel[k] = null;  // no longer available
+    });
+    cascadeEl.innerHTML = D.levels.map((lvl, k) =>
+      `<label>${esc(lvl.name)}<select data-level="${k}"><option value="-1">(All)</option>` +
+      opts[k].map((o, j) => `<option value="${j}"${o === sel[k] ? " selected" : ""}>${esc(o)}</option>`).join("") +
+      `</select></label>`).join("");
+  }
+  cascadeEl.addEventListener("change", ev => {
+    const k = Number(ev.target.dataset.level), j = Number(ev.target.value);
+    sel[k] = j < 0 ? null : opts[k][j];
+    refresh();
+  });
+
+  // ---- Windowed table: only the visible slice (+ overscan) is in the DOM ----
+  const esc = v => String(v).replace(/[&<>"]/g, ch => ({ "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;" })[ch]);
+  const TD = `<td style="height:${ROW_H - 1}px">`;
+  let view = [], first = -1, last = -1, queued = false;
+
+  function cell(c, i) { const k = c.codes[i]; return k < 0 ? "" : c.dict[k]; }
+  function paint(force) {
+    const top = scrollEl.scrollTop, h = scrollEl.clientHeight || 340;
+    const a = Math.max(0, Math.floor(top / ROW_H) - OVERSCAN);
+    const b = Math.min(view.length, Math.ceil((top + h) / ROW_H) + OVERSCAN);
+    if (!force && a === first && b === last) return;
+    first = a; last = b;
+    const out = [`<tr style="height:${a * ROW_H}px"></tr>`];
+    for (let j = a; j < b; j++) {
+      const i = view[j];
+      out.push("<tr>" + D.cols.map(c => TD + esc(cell(c, i)) + "</td>").join("") + "</tr>");
+    }
+    out.push(`<tr style="height:${(view.length - b) * ROW_H}px"></tr>`);
+    tbody.innerHTML = out.join("");
+  }
+  scrollEl.addEventListener("scroll", () => {
+    if (queued) return;
+    queued = true;
+    requestAnimationFrame(() => { queued = false; paint(false); });
+  }, { passive: true });
+
+  function renderTable(rows, total) {
+    view = rows; scrollEl.scrollTop = 0; paint(true);
+    metaEl.textContent = `Showing ${rows.length} of ${total ?? rows.length} row(s).`;
+  }
+  function selectNode(id) {
+    const k = D.pos.get(id);
+    if (!id || id === ROOT || k === undefined) {
+      badgeEl.textContent = id && id !== ROOT ? id.split(DELIM).join(" > ") : "All";
+      renderTable(id && id !== ROOT ? [] : rowsOf(0), k === undefined ? undefined : V.value[k]);
+      return;
+    }
+    badgeEl.textContent = id.split(DELIM).join(" > ");
+    renderTable(rowsOf(k), V.value[k]);
+  }
+
+  // ---- Render ----
+  let clickBound = false;
+  async function refresh() {
+    if (cascadeOn) buildCascade();
+    V = buildView();
+    const data = [{
+      type: "sunburst", ids: V.ids, labels: V.labels, parents: V.parents, values: V.values,
+      branchvalues: "total", maxdepth: 3,
+      hovertemplate: "%{label}<br>%{value} items<extra></extra>",
+    }];
+    const layout = { margin: { l: 4, r: 4, t: 4, b: 4 }, paper_bgcolor: "#fff", plot_bgcolor: "#fff" };
+    await Plotly.react(chartEl, data, layout, { displaylogo: false, responsive: true });
+    if (!clickBound) {
+      clickBound = true;
+      chartEl.on("plotly_click", ev => {
+        const id = String(ev?.points?.[0]?.id || ROOT);
+        selectNode(id);
+        if (reportClicks) setValue({ node: id, version: D.version });
+      });
+    }
+    selectNode(ROOT);
+    fitFrame();
+  }
+
+  async function render(args) {
+    chartEl.style.height = args.chart_height + "px";
+    scrollEl.style.maxHeight = args.table_height + "px";
+    const cascade = !!args.cascade, reset = args.reset !== lastReset, modeChanged = cascade !== cascadeOn;
+    cascadeOn = cascade; reportClicks = args.report_clicks !== false; lastReset = args.reset;
+    cascadeEl.style.display = cascadeOn ? "flex" : "none";
+    if (reset || !cascadeOn) sel = [];
+    if (!D || D.version !== args.version) {
+      if (args.payload == null) {
+        // Remounted (or never received this version): ask Python to send the data again.
+        if (requested !== args.version) { requested = args.version; setValue({ node: null, version: null, missing: args.version }); }
+        return;
+      }
+      const [P] = await Promise.all([decodePayload(args.payload), loadPlotly(args.plotly_src)]);
+      D = unpack(args.version, P);
+      thead.innerHTML = D.cols.map(c => `<th>${esc(c.name)}</th>`).join("");
+      await refresh();
+      if (requested === args.version) { requested = null; setValue({ node: null, version: D.version }); }
+    } else if (reset || modeChanged) {
+      await refresh();
+    }
+    fitFrame();
+  }
+
+  let queue = Promise.resolve();
+  window.addEventListener("message", ev => {
+    const msg = ev.data;
+    if (!msg || msg.type !== "streamlit:render") return;
+    queue = queue.then(() => render(msg.args)).catch(err => { metaEl.textContent = String(err); });
+  });
+  send("streamlit:componentReady", { apiVersion: 1 });
+})();
@@ -0,0 +1,180 @@
+# Register-level data services for the KPI cards and the Overview / Summary tabs
+# (materials, drawings, NCR, WIR, method statements).
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+# -------------------- Filter engine --------------------
+# Per register, built once per data version: one boolean row bitmap per Source / Discipline
+# value and the row order sorted by Date. A sidebar filter is then a few bitmap ORs/ANDs plus
+# two searchsorted calls, and filters that exclude nothing are skipped, so the unfiltered
+# case hands back the register itself instead of a copy.
+FILTER_COLS = ("Source", "Discipline")
+
+
+class FilterIndex(NamedTuple):
+    n_rows: int
+    bitmaps: dict      # column -> {value: bool[n_rows]}
+    complete: dict     # column -> True when no row is missing a value
+    date_order: "np.ndarray | None"  # row positions with a Date, sorted by Date
+    dates: "np.ndarray | None"       # Date values in date_order order
+    all_dated: bool    # no missing Dates
+
+
+def build_filter_index(df: pd.DataFrame, cols=FILTER_COLS, date_col: str = "Date") -> FilterIndex:
+    bitmaps, complete = {}, {}
+    for c in cols:
+        if c not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[c], sort=True)
+        bitmaps[c] = {v: codes == i for i, v in enumerate(uniques)}
+        complete[c] = bool((codes >= 0).all())
+    date_order = dates = None
+    all_dated = True
+    if date_col in df.columns:
+        values = pd.to_datetime(df[date_col]).to_numpy()
+        valid = np.flatnonzero(~np.isnat(values))
+        all_dated = len(valid) == len(df)
+        date_order = valid[np.argsort(values[valid], kind="stable")]
+        dates = values[date_order]
+    return FilterIndex(len(df), bitmaps, complete, date_order, dates, all_dated)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def filter_index(version: str, _df: pd.DataFrame) -> FilterIndex:
+    # version identifies the register content; _df itself is not hashed.
+    return build_filter_index(_df)
+
+
+def day_bounds(date_range) -> "tuple[np.datetime64, np.datetime64]":
+    # The Date Range filter is day-inclusive: a row matches when its Date falls on a day in
+    # [start, end], i.e. start 00:00 <= Date < the day after end. Shared by the row filter and
+    # the KPI cube so both count a 14:00 timestamp on the end day the same way.
+    start, end = (pd.Timestamp(d).floor("D") for d in date_range)
+    return np.datetime64(start, "ns"), np.datetime64(end + pd.Timedelta(days=1), "ns")
+
+
+def select_rows(index: FilterIndex, isin: dict, date_range=None) -> "np.ndarray | None":
+    """
+    Ascending positions of rows whose columns are in the given value lists and whose Date
+    falls on a day in [start, end] (day_bounds). None means no row is excluded.
+    """
+    mask = None
+    for col, values in isin.items():
+        maps = index.bitmaps.get(col)
+        if maps is None:
+            continue
+        hit = [maps[v] for v in dict.fromkeys(values) if v in maps]
+        if len(hit) == len(maps) and index.complete[col]:
+            continue  # every row's value is selected
+        m = np.logical_or.reduce(hit) if hit else np.zeros(index.n_rows, dtype=bool)
+        mask = m if mask is None else mask & m
+
+    if date_range is not None and index.dates is not None:
+        start, stop = day_bounds(date_range)
+        lo = np.searchsorted(index.dates, start, side="left")
+        hi = np.searchsorted(index.dates, stop, side="left")
+        if not (lo == 0 and hi == len(index.dates) and index.all_dated):
+            m = np.zeros(index.n_rows, dtype=bool)
+            m[index.date_order[lo:hi]] = True
+            mask = m if mask is None else mask & m
+
+    return None if mask is None else np.flatnonzero(mask)
+
+
+# -------------------- KPI cube --------------------
+# Additive Source x Discipline x day cells per register, built once per data version. KPI
+# tiles (and the Handover Readiness Index) sum the cells matching the sidebar filters, so
+# their cost depends on the number of cells, not on register size. Day buckets match the
+# day-granular Date Range filter.
+CUBE_MEASURES = ("Submitted", "Approved", "ApprovedWithComments", "Rejected", "UR")
+CUBE_STATUSES = ("Open", "Closed")
+
+
+class KpiCube(NamedTuple):
+    keys: dict      # "Source" / "Discipline" -> cell labels
+    days: "np.ndarray | None"  # datetime64 day of each cell
+    measures: dict  # measure -> per-cell totals; "Rows" counts register rows
+
+
+def build_kpi_cube(df: pd.DataFrame, date_col: str = "Date") -> KpiCube:
+    keys = [c for c in FILTER_COLS if c in df.columns]
+    cells = pd.DataFrame({c: df[c] for c in keys})
+    if date_col in df.columns:
+        cells["_day"] = pd.to_datetime(df[date_col]).dt.floor("D")
+    cells["Rows"] = 1
+    for m in CUBE_MEASURES:
+        if m in df.columns:
+            cells[m] = df[m]
+    if "Status" in df.columns:
+        for status in CUBE_STATUSES:
+            cells[status] = (df["Status"] == status).astype(np.int64)
+    by = [c for c in cells.columns if c in keys or c == "_day"]
+    if by:
+        cells = cells.groupby(by, dropna=False, observed=True, sort=False).sum().reset_index()
+    measures = {m: cells[m].to_numpy(dtype=np.int64) for m in cells.columns if m not in by}
+    days = cells["_day"].to_numpy() if "_day" in cells.columns else None
+    return KpiCube({c: cells[c].to_numpy() for c in keys}, days, measures)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def kpi_cube(version: str, _df: pd.DataFrame) -> KpiCube:
+    return build_kpi_cube(_df)
+
+
+def cube_mask(cube: KpiCube, isin: dict, date_range=None) -> np.ndarray:
+    # Same row semantics as select_rows: isin on each key column, day_bounds for the Date range.
+    n_cells = len(next(iter(cube.measures.values())))
+    mask = np.ones(n_cells, dtype=bool)
+    for col, values in isin.items():
+        if col in cube.keys:
+            mask &= pd.Index(cube.keys[col]).isin(list(values))
+    if date_range is not None and cube.days is not None:
+        start, stop = day_bounds(date_range)
+        mask &= (cube.days >= start) & (cube.days < stop)
+    return mask
+
+
+def cube_totals(cube: KpiCube, isin: dict, date_range=None) -> dict:
+    mask = cube_mask(cube, isin, date_range)
+    return {m: int(v[mask].sum()) for m, v in cube.measures.items()}
+
+
+# -------------------- Group sums --------------------
+# Per-Discipline / per-Source measure sums for the Overview charts, the AG and CloseoutSoft
+# summaries and the comparison, read off the KPI cube cells and memoized per
+# (register version, grouping, filter state). Tabs showing the same numbers (Material
+# Submissions appears in two) share one result, and the long form for the stacked bars is
+# cached with it. Results are shared across sessions: never mutate them.
+class GroupSums(NamedTuple):
+    rows: int            # register rows passing the filters
+    wide: pd.DataFrame   # by + measures, one row per group value (missing keys dropped)
+    long: pd.DataFrame   # by, "Status", "Count": wide melted over the measures
+
+
+def filter_key(isin: dict, date_range=None) -> tuple:
+    # Hashable form of the sidebar filter state, for the group_sums cache key.
+    return (
+        tuple((c, tuple(v)) for c, v in sorted(isin.items())),
+        None if date_range is None else tuple(pd.Timestamp(d) for d in date_range),
+    )
+
+
+def build_group_sums(cube: KpiCube, by: str, measures, isin: dict, date_range=None) -> GroupSums:
+    mask = cube_mask(cube, isin, date_range)
+    measures = [m for m in measures if m in cube.measures]
+    cells = pd.DataFrame({by: cube.keys[by][mask], **{m: cube.measures[m][mask] for m in measures}})
+    wide = cells.groupby(by, sort=True).sum().reset_index()
+    long = wide.melt(id_vars=by, value_vars=measures, var_name="Status", value_name="Count")
+    return GroupSums(int(cube.measures["Rows"][mask].sum()), wide, long)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def group_sums(version: str, _df: pd.DataFrame, by: str, measures: tuple, filters: tuple) -> GroupSums:
+    # filters is filter_key(isin, date_range); the cube comes from the kpi_cube cache.
+    isin, date_range = filters
+    return build_group_sums(kpi_cube(version, _df), by, measures, dict(isin), date_range)
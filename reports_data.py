@@ -0,0 +1,761 @@
+# Reports.json / Reports.xlsx ingestion for the Submittals tab.
+# Parsed + mapped frames are cached process-wide (shared by every session) and keyed by a
+# source fingerprint, so a rerun only re-parses when the file itself has changed.
+# Cached frames are shared objects: slice them, never modify them in place.
+
+import functools
+import gzip
+import hashlib
+import io
+import json as _json
+import os
+import re
+import sys
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import streamlit as st
+
+
+REPORT_NAMES = ("Reports.json", "Reports.xlsx")
+# REPORTS_FILE=/path/to/export.json loads that file instead of looking next to the app
+REPORTS_FILE = os.environ.get("REPORTS_FILE", "")
+KEEP_COLS = [
+    "Discipline", "System", "Subsystem", "Status", "Activity",
+    "SubmittalDate", "InternalRefNumber", "Company", "Building", "Level", "Room",
+]
+# Low-cardinality text columns, dictionary-encoded as pandas categoricals by the loader
+DIM_COLS = ["Discipline", "System", "Subsystem", "Status", "Activity", "Company", "Building", "Level", "Room"]
+BLANK = "—"
+
+# JSON exports at least this big are streamed record by record instead of json.load()-ed whole
+JSON_STREAM_MIN_BYTES = 32 * 1024 * 1024
+JSON_READ_CHARS = 1 << 20
+JSON_CHUNK_ROWS = 50_000
+
+# Full-dataset mode (default): charts aggregate every row and only a bounded page of detail
+# rows goes to the browser. REPORTS_FULL_DATASET=0 restores the old recent-window + MAX_ROWS shrink.
+# The component's table is windowed, so REPORTS_DETAIL_ROWS only bounds the payload size.
+FULL_DATASET = os.environ.get("REPORTS_FULL_DATASET", "1") != "0"
+DETAIL_ROWS = int(os.environ.get("REPORTS_DETAIL_ROWS", "5000"))
+
+# Shrink limits for cloud rendering (sampled mode only)
+RECENT_MONTHS = 24
+RECENT_MIN_ROWS = 1000
+MAX_ROWS = 5000
+
+
+# -------------------- Column mapping --------------------
+# Alias table, compiled once into normalized aliases. Resolution ranks exact matches above
+# substring matches, then alias priority, then the more specific (longer) alias, and gives
+# each source column to at most one target, so "system" can no longer claim "SubsystemName"
+# ahead of Subsystem. Results are cached per header signature.
+COLUMN_ALIASES = {
+    "Discipline": ["discipline", "trade", "division", "disciplinename"],
+    "System": ["system", "systemname", "systems"],
+    "Subsystem": ["subsystem", "subsystemname", "sub_system", "sub-system", "subsystemdesc", "subsystemdescription", "subsystemtype"],
+    "Status": ["status", "submittalstatus", "state", "stage", "approvalstatus"],
+    "Activity": ["activity", "activitytype", "register", "category"],
+    "SubmittalDate": ["submittaldate", "date", "submittedon"],
+    "InternalRefNumber": ["internalrefnumber", "refno", "internalref", "reference", "referenceid"],
+    "Company": ["createdcompanyname", "company", "createdbycompany", "originatorcompany"],
+    "Building": ["building", "buildingname"],
+    "Level": ["level", "floor", "storey"],
+    "Room": ["room", "roomname"],
+}
+
+
+class ColumnMatch(NamedTuple):
+    target: str
+    source: str
+    alias: str
+    exact: bool
+
+
+def _norm(s: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", s.lower())
+
+
+def _compile_aliases() -> "list[tuple[int, str, int, str]]":
+    # (target order, target, alias priority, normalized alias), duplicates after normalization dropped
+    index = []
+    for t_idx, (target, aliases) in enumerate(COLUMN_ALIASES.items()):
+        seen = []
+        for alias in map(_norm, aliases):
+            if alias not in seen:
+                seen.append(alias)
+        index.extend((t_idx, target, a_idx, alias) for a_idx, alias in enumerate(seen))
+    return index
+
+
+_ALIAS_INDEX = _compile_aliases()
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_header(columns: tuple) -> "tuple[ColumnMatch, ...]":
+    normed = [_norm(str(c)) for c in columns]
+    ranked = []
+    for t_idx, target, a_idx, alias in _ALIAS_INDEX:
+        for c_idx, norm_col in enumerate(normed):
+            if norm_col == alias:
+                ranked.append(((0, a_idx, 0, t_idx, c_idx), target, c_idx, alias))
+            elif alias in norm_col:
+                ranked.append(((1, a_idx, -len(alias), t_idx, c_idx), target, c_idx, alias))
+    ranked.sort(key=lambda r: r[0])
+    taken_targets, taken_cols, matches = set(), set(), {}
+    for key, target, c_idx, alias in ranked:
+        if target in taken_targets or c_idx in taken_cols:
+            continue
+        taken_targets.add(target)
+        taken_cols.add(c_idx)
+        matches[target] = ColumnMatch(target, columns[c_idx], alias, key[0] == 0)
+    return tuple(matches[t] for t in COLUMN_ALIASES if t in matches)
+
+
+def resolve_columns(columns) -> "tuple[ColumnMatch, ...]":
+    return _resolve_header(tuple(columns))
+
+
+def _resolve_mapping(columns) -> dict:
+    # {real column: target} for a header; only needs column names, not data.
+    return {m.source: m.target for m in resolve_columns(columns)}
+
+
+def _auto_map_columns(df: pd.DataFrame) -> pd.DataFrame:
+    if df is None or df.empty:
+        return df
+    rename = _resolve_mapping(df.columns)
+    if rename:
+        df = df.rename(columns=rename)
+    df = df[[c for c in KEEP_COLS if c in df.columns]].copy()
+    return df
+
+
+def _projected_columns(columns) -> list:
+    # Source columns worth loading; empty when the header can't supply Discipline + System.
+    rename = _resolve_mapping(columns)
+    if not {"Discipline", "System"} <= set(rename.values()):
+        return []
+    return [c for c in columns if c in rename]
+
+
+# -------------------- Parsing --------------------
+# A header-only probe resolves the column mapping first, so the full read only loads the
+# ~11 mapped columns (usecols for Excel, key projection while decoding JSON) rather than
+# every free-text field an export happens to carry.
+def _read_excel_projected(open_src) -> pd.DataFrame:
+    header = pd.read_excel(open_src(), sheet_name=0, nrows=0).columns
+    usecols = _projected_columns(header)
+    return pd.read_excel(open_src(), sheet_name=0, usecols=usecols or None)
+
+
+def _projecting_hook():
+    keep_by_sig = {}
+
+    def hook(d: dict) -> dict:
+        sig = tuple(d)
+        keep = keep_by_sig.get(sig)
+        if keep is None:
+            keep = keep_by_sig[sig] = tuple(_projected_columns(sig))
+        return {k: d[k] for k in keep} if keep else d
+
+    return hook
+
+
+# ---- Streaming JSON: locate the record array, decode one record at a time ----
+# Only the current read window, the projected column buffers of the open chunk and the
+# already-typed chunk frames are alive at once, so peak memory no longer tracks the size
+# of the document's Python object tree.
+class _NoRecordArray(Exception):
+    pass
+
+
+_decoder = _json.JSONDecoder()
+_WS = " \t\n\r"
+_NUM_TAIL = "0123456789.eE+-"
+
+
+class _JsonStream:
+    # Pull reader over a text file: whitespace/punctuation by hand, values via raw_decode.
+    def __init__(self, f):
+        self.f, self.buf, self.pos, self.eof = f, "", 0, False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(JSON_READ_CHARS)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"Malformed JSON: expected {ch!r}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except _json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the window edge decodes short ("12" of "125", "-3" of "-3.5e2"): refill
+            # while nothing but number characters follow it in the buffer.
+            if (end == len(self.buf) or (isinstance(obj, (int, float))
+                                         and not self.buf[end:].strip(_NUM_TAIL))) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def _iter_json_records(f):
+    # Same record array the eager path picks: the top-level list, or the first list-valued key.
+    s = _JsonStream(f)
+    head = s.peek()
+    if head == "{":
+        s.expect("{")
+        while True:
+            if s.peek() != '"':
+                raise _NoRecordArray
+            s.value()
+            s.expect(":")
+            if s.peek() == "[":
+                break
+            s.value()
+            if s.peek() == ",":
+                s.pos += 1
+    elif head != "[":
+        raise _NoRecordArray
+    s.expect("[")
+    if s.peek() == "]":
+        return
+    while True:
+        yield s.value()
+        ch = s.peek()
+        if ch == ",":
+            s.pos += 1
+        elif ch == "]":
+            return
+        else:
+            raise ValueError("Malformed JSON: expected ',' or ']'")
+
+
+def _read_json_streaming(f) -> pd.DataFrame:
+    keep_by_sig, cols, chunks, n = {}, {}, [], 0
+    for rec in _iter_json_records(f):
+        if not isinstance(rec, dict):
+            raise _NoRecordArray
+        sig = tuple(rec)
+        keep = keep_by_sig.get(sig)
+        if keep is None:
+            keep = keep_by_sig[sig] = tuple(_projected_columns(sig)) or sig
+        for k in keep:
+            if k not in cols:
+                cols[k] = [None] * n
+        for k, buf in cols.items():
+            buf.append(rec.get(k))
+        n += 1
+        if n == JSON_CHUNK_ROWS:
+            chunks.append(pd.DataFrame(cols))
+            cols, n = {k: [] for k in cols}, 0
+    if n or not chunks:
+        chunks.append(pd.DataFrame(cols))
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+
+def _frame_from_json(j, raw) -> pd.DataFrame:
+    if isinstance(j, list):
+        return pd.DataFrame(j)
+    if isinstance(j, dict):
+        list_key = next((k for k, v in j.items() if isinstance(v, list)), None)
+        return pd.DataFrame(j[list_key]) if list_key else pd.json_normalize(j)
+    return pd.read_json(raw)
+
+
+def read_reports_file(path: Path) -> pd.DataFrame:
+    if path.suffix.lower() == ".json":
+        if path.stat().st_size >= JSON_STREAM_MIN_BYTES:
+            try:
+                with path.open("r", encoding="utf-8") as f:
+                    return _read_json_streaming(f)
+            except _NoRecordArray:
+                pass
+        with path.open("r", encoding="utf-8") as f:
+            j = _json.load(f, object_hook=_projecting_hook())
+        return _frame_from_json(j, path)
+    return _read_excel_projected(lambda: path)
+
+
+def read_reports_bytes(name: str, data: bytes) -> pd.DataFrame:
+    if name.lower().endswith(".json"):
+        if len(data) >= JSON_STREAM_MIN_BYTES:
+            try:
+                return _read_json_streaming(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"))
+            except _NoRecordArray:
+                pass
+        j = _json.loads(data.decode("utf-8"), object_hook=_projecting_hook())
+        return _frame_from_json(j, io.BytesIO(data))
+    return _read_excel_projected(lambda: io.BytesIO(data))
+
+
+# -------------------- Dimensions (categoricals) --------------------
+# Each dimension gets one sorted string dictionary for the whole file. Row slices keep it, so
+# equality filters, groupby and option lists work on integer codes and the category order is
+# already the sorted option order. Missing values stay missing (code -1) until display.
+def encode_dimension(s: pd.Series) -> pd.Series:
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s
+    values = s
+    if s.dtype != object or pd.api.types.infer_dtype(s, skipna=True) != "string":
+        # ints and strings mixed (Level 1 / "Roof") can't be sorted into one dictionary
+        values = s.map(lambda v: v if pd.isna(v) else str(v))
+    return values.astype(pd.CategoricalDtype(sorted(values.dropna().unique())))
+
+
+def fill_dimension(s: pd.Series, blank: str = BLANK) -> pd.Series:
+    # Display form: missing -> blank placeholder, without leaving the categorical dtype.
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        if not s.isna().any():
+            return s
+        if blank not in s.cat.categories:
+            s = s.cat.add_categories([blank])
+        return s.fillna(blank)
+    return s.fillna(blank).astype(str)
+
+
+def dimension_options(s: pd.Series) -> list:
+    # Sorted distinct non-missing values present in s.
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = pd.unique(s.cat.codes.to_numpy())
+        cats = s.cat.categories
+        return [cats[i] for i in sorted(c for c in codes if c >= 0)]
+    return sorted(s.dropna().astype(str).unique().tolist())
+
+
+class LoadedReports(NamedTuple):
+    # df is None when nothing was read (rows_read == 0) or Discipline/System could not be mapped.
+    df: "pd.DataFrame | None"
+    rows_read: int
+    mapping: "tuple[ColumnMatch, ...]" = ()
+    version: str = ""  # cache key of the source version; stable across reruns
+
+
+def normalize_reports(df: pd.DataFrame) -> LoadedReports:
+    """
+    Auto-map columns and coerce dates; the chosen mapping is returned for validation.
+    """
+    if df is None or df.empty:
+        return LoadedReports(None, 0)
+    orig_len = len(df)
+    mapping = resolve_columns(df.columns)
+    df = _auto_map_columns(df)
+    if df is None or df.empty or "Discipline" not in df.columns or "System" not in df.columns:
+        return LoadedReports(None, orig_len, mapping)
+    if "SubmittalDate" in df.columns:
+        df["SubmittalDate"] = pd.to_datetime(df["SubmittalDate"], errors="coerce")
+    for c in df.columns:
+        # Excel exports mix ints and strings (e.g. Level 1 / "Roof"); everything but the date
+        # is shown as text anyway, and a single type keeps the frame Arrow-serializable.
+        if c in DIM_COLS:
+            df[c] = encode_dimension(df[c])
+        elif df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True).startswith("mixed"):
+            df[c] = df[c].map(lambda v: v if pd.isna(v) else str(v))
+    return LoadedReports(df, orig_len, mapping)
+
+
+def shrink_reports(df: pd.DataFrame) -> pd.DataFrame:
+    # Keep the recent window (if it is big enough), then cap rows for cloud rendering.
+    if "SubmittalDate" in df.columns and df["SubmittalDate"].notna().any():
+        cutoff = df["SubmittalDate"].max() - pd.DateOffset(months=RECENT_MONTHS)
+        recent = df[df["SubmittalDate"] >= cutoff]
+        if len(recent) >= RECENT_MIN_ROWS:
+            df = recent
+
+    if len(df) > MAX_ROWS:
+        if "SubmittalDate" in df.columns:
+            df = df.sort_values("SubmittalDate", ascending=False).head(MAX_ROWS).copy()
+        else:
+            df = df.head(MAX_ROWS).copy()
+    return df
+
+
+def prepare_reports(df: pd.DataFrame, full: bool = True) -> LoadedReports:
+    loaded = normalize_reports(df)
+    if full or loaded.df is None:
+        return loaded
+    return loaded._replace(df=shrink_reports(loaded.df))
+
+
+def detail_page(df: pd.DataFrame, by: list, limit: int = DETAIL_ROWS) -> pd.DataFrame:
+    """
+    At most `limit` rows of df, most recent first, spread round-robin over the `by` groups
+    so every group (sunburst leaf) keeps at least one detail row when there are <= limit groups.
+    """
+    if len(df) <= limit:
+        return df
+    if "SubmittalDate" in df.columns:
+        df = df.sort_values("SubmittalDate", ascending=False, kind="stable")
+    if not by:
+        return df.head(limit)
+    rank = df.groupby(by, observed=True, dropna=False, sort=False).cumcount().to_numpy()
+    pos = np.lexsort((np.arange(len(df)), rank))[:limit]
+    return df.iloc[np.sort(pos)]
+
+
+# -------------------- Submittals hierarchy index --------------------
+# Discipline -> System -> Subsystem tree built once per dataset version: each node path maps
+# to its children (in dictionary/sorted order) and to the ascending row positions under it.
+# The cascading selectboxes and the filtered slice become dict lookups plus a take().
+# A None in a selection means "(All)" at that level.
+HIERARCHY = ["Discipline", "System", "Subsystem"]
+SUBMITTALS_DIMS = ["Discipline", "System", "Subsystem", "Status", "Activity"]
+
+
+class HierarchyIndex(NamedTuple):
+    levels: list
+    children: dict  # node path -> child labels
+    rows: dict      # node path -> int32 row positions
+    order: dict     # level -> {label: sort rank}
+
+
+def build_hierarchy(df: pd.DataFrame) -> HierarchyIndex:
+    levels = [c for c in HIERARCHY if c in df.columns]
+    order = {}
+    for c in levels:
+        labels = list(df[c].cat.categories) if isinstance(df[c].dtype, pd.CategoricalDtype) else sorted(df[c].unique())
+        order[c] = {v: i for i, v in enumerate(labels)}
+    children, rows = {(): []}, {}
+    for depth in range(1, len(levels) + 1):
+        groups = df.groupby(levels[:depth], observed=True, dropna=False, sort=False).indices
+        for key, pos in groups.items():
+            path = key if isinstance(key, tuple) else (key,)
+            rows[path] = pos.astype(np.int32)
+            children.setdefault(path[:-1], []).append(path[-1])
+    for path, kids in children.items():
+        kids.sort(key=order[levels[len(path)]].__getitem__)
+    return HierarchyIndex(levels, children, rows, order)
+
+
+def _expand_selection(index: HierarchyIndex, sel) -> list:
+    paths = [()]
+    for v in sel:
+        if v is None:
+            paths = [p + (c,) for p in paths for c in index.children.get(p, ())]
+        else:
+            paths = [p + (v,) for p in paths if p + (v,) in index.rows]
+    return paths
+
+
+def hierarchy_options(index: HierarchyIndex, sel) -> list:
+    # Labels available at level len(sel) under the selection.
+    if len(sel) >= len(index.levels):
+        return []
+    paths = _expand_selection(index, sel)
+    if len(paths) == 1:
+        return list(index.children.get(paths[0], ()))
+    labels = {c for p in paths for c in index.children.get(p, ())}
+    return sorted(labels, key=index.order[index.levels[len(sel)]].__getitem__)
+
+
+def hierarchy_rows(index: HierarchyIndex, sel) -> "np.ndarray | None":
+    # Ascending row positions matching the selection; None means every row.
+    sel = list(sel)[: len(index.levels)]
+    while sel and sel[-1] is None:
+        sel.pop()
+    if not sel:
+        return None
+    paths = _expand_selection(index, sel)
+    if not paths:
+        return np.empty(0, dtype=np.int32)
+    if len(paths) == 1:
+        return index.rows[paths[0]]
+    return np.sort(np.concatenate([index.rows[p] for p in paths]))
+
+
+def sunburst_nodes(df: pd.DataFrame, levels: list, delim: str = "|||", root: str = "ROOT") -> pd.DataFrame:
+    """
+    id / label / parent / Count of every sunburst node: the root, then each level in sorted
+    order. Leaf counts come from a single groupby; parent levels roll those counts up, and
+    the delimiter-joined ids are built column-wise.
+    """
+    frames = [pd.DataFrame({"id": [root], "label": ["All"], "parent": [""], "Count": [len(df)]})]
+    if not levels:
+        return frames[0]
+    counts = df.groupby(levels, observed=True, dropna=False, sort=True).size()
+    for depth in range(1, len(levels) + 1):
+        if depth < len(levels):
+            c = counts.groupby(level=list(range(depth)), observed=True, dropna=False, sort=True).sum()
+        else:
+            c = counts
+        keys = c.index if isinstance(c.index, pd.MultiIndex) else pd.MultiIndex.from_arrays([c.index])
+        labels = [pd.Series(keys.get_level_values(i).astype(str), dtype=object) for i in range(depth)]
+        parent = labels[0].copy() if depth > 1 else pd.Series(root, index=labels[0].index, dtype=object)
+        for lab in labels[1:-1]:
+            parent = parent + delim + lab
+        node_id = labels[0] if depth == 1 else parent + delim + labels[-1]
+        frames.append(pd.DataFrame({"id": node_id, "label": labels[-1], "parent": parent,
+                                    "Count": c.to_numpy(dtype=np.int64)}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def node_row_index(page: pd.DataFrame, levels: list, nodes: pd.DataFrame, delim: str = "|||") -> dict:
+    """
+    Per hierarchy depth, the row positions of page sorted by the path down to that depth
+    (stable, so every group keeps page order), plus each sunburst node's
+    [start, start + length) slice of its depth's order. Nodes without rows in page get
+    length 0; the root covers page as is.
+    """
+    n = len(page)
+    start = np.zeros(len(nodes), dtype=np.int64)
+    length = np.zeros(len(nodes), dtype=np.int64)
+    length[0] = n
+    orders = []
+    labels = [page[c].astype(str).to_numpy(dtype=object) for c in levels] if n else []
+    codes = [pd.factorize(lab, sort=True)[0] for lab in labels]
+    pos = pd.Index(nodes["id"])
+    for depth in range(1, len(labels) + 1):
+        order = np.lexsort([np.arange(n)] + codes[:depth][::-1])
+        key = labels[0][order]
+        for lab in labels[1:depth]:
+            key = key + delim + lab[order]
+        first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        node = pos.get_indexer(key[first])
+        ok = node >= 0
+        start[node[ok]] = first[ok]
+        length[node[ok]] = np.diff(np.r_[first, n])[ok]
+        orders.append(order.tolist())
+    return {"orders": orders, "start": start.tolist(), "length": length.tolist()}
+
+
+def prepare_hierarchy(df: pd.DataFrame) -> "tuple[pd.DataFrame, HierarchyIndex]":
+    df = pd.DataFrame(df)
+    for c in SUBMITTALS_DIMS:
+        if c in df.columns:
+            df[c] = fill_dimension(df[c])
+    return df, build_hierarchy(df)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def submittals_hierarchy(version: str, _df: pd.DataFrame, _rows=None) -> "tuple[pd.DataFrame, HierarchyIndex]":
+    # version identifies _df.take(_rows) (source version + Activity filter); neither is hashed,
+    # so a cache hit never materializes the Activity slice.
+    return prepare_hierarchy(_df if _rows is None else _df.take(_rows))
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def activity_rows(version: str, _df: pd.DataFrame) -> dict:
+    # {Activity: row positions} in option order, once per dataset version: the Activity filter
+    # is a lookup here instead of a full-column mask on every rerun.
+    return dict(sorted(_df.groupby("Activity", observed=True).indices.items()))
+
+
+# -------------------- Component payload --------------------
+# The Submittals component receives columns, not row objects: each detail column is a string
+# table plus one small-int code per row (-1 = empty), and the sunburst nodes ship as label
+# codes plus parent positions, from which the browser rebuilds the '|||' ids. The payload
+# travels as a gzip'd bytes arg (DecompressionStream in the browser); REPORTS_PAYLOAD_GZIP=0
+# sends it as a plain JSON arg instead.
+PAYLOAD_GZIP = os.environ.get("REPORTS_PAYLOAD_GZIP", "1") != "0"
+PAYLOAD_DIMS = ["Discipline", "System", "Subsystem", "Status", "Activity",
+                "InternalRefNumber", "Company", "Building", "Level", "Room"]
+PAYLOAD_COLS = ["Discipline", "System", "Subsystem", "Status", "SubmittalDate", "InternalRefNumber", "Company", "Building"]
+
+
+def encode_column(s: pd.Series) -> dict:
+    codes, uniques = pd.factorize(s, sort=False)
+    return {"dict": pd.Index(uniques).tolist(), "codes": codes.tolist()}
+
+
+def encode_frame(df: pd.DataFrame) -> dict:
+    return {"n": len(df), "columns": [{"name": c, **encode_column(df[c])} for c in df.columns]}
+
+
+def encode_nodes(nodes: pd.DataFrame) -> dict:
+    # nodes as returned by sunburst_nodes (parents listed before their children).
+    codes, labels = pd.factorize(nodes["label"], sort=False)
+    parent = pd.Index(nodes["id"]).get_indexer(nodes["parent"])
+    return {"labels": labels.tolist(), "label": codes.tolist(), "parent": parent.tolist(),
+            "value": nodes["Count"].astype(np.int64).tolist()}
+
+
+def encode_payload(obj) -> "bytes | dict":
+    if not PAYLOAD_GZIP:
+        return obj
+    raw = _json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return gzip.compress(raw.encode("utf-8"), compresslevel=6)
+
+
+def build_submittals_payload(df: pd.DataFrame, delim: str = "|||", root: str = "ROOT") -> dict:
+    # Counts use every row; only a bounded page of detail rows is shipped to the browser.
+    df = pd.DataFrame(df).copy()
+    for c in PAYLOAD_DIMS:
+        if c in df.columns:
+            df[c] = fill_dimension(df[c])
+    levels = [c for c in HIERARCHY if c in df.columns]
+    cols = [c for c in PAYLOAD_COLS if c in df.columns]
+    page = detail_page(df, levels)[cols].copy()
+    if "SubmittalDate" in page.columns:
+        page["SubmittalDate"] = pd.to_datetime(page["SubmittalDate"], errors="coerce")\
+                                   .dt.strftime("%Y-%m-%d %H:%M").fillna("")
+    nodes = sunburst_nodes(df, levels, delim, root)
+    return {
+        "nodes": encode_nodes(nodes),
+        "rows": encode_frame(page),
+        "index": node_row_index(page, levels, nodes, delim),
+        # per level, its labels in option order (for the in-component cascade)
+        "levels": [{"name": c, "labels": [str(v) for v in dimension_options(df[c])]} for c in levels],
+    }
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def submittals_payload(version: str, _df: pd.DataFrame) -> "bytes | dict":
+    # version identifies _df (dataset, Activity and cascade selection); _df itself is not hashed.
+    return encode_payload(build_submittals_payload(_df))
+
+
+# -------------------- Columnar sidecar (Arrow IPC / Feather v2) --------------------
+# The normalized frame is written uncompressed next to the source (Reports.xlsx -> Reports.xlsx.arrow)
+# so later cold loads memory-map it instead of going through openpyxl / json. The source
+# fingerprint and SIDECAR_VERSION are stored in the schema metadata; any mismatch rebuilds it.
+SIDECAR_SUFFIX = ".arrow"
+SIDECAR_VERSION = "3"
+
+
+def sidecar_path(source: Path) -> Path:
+    return source.with_name(source.name + SIDECAR_SUFFIX)
+
+
+def _sidecar_meta(size: int, mtime_ns: int, loaded: LoadedReports) -> dict:
+    return {
+        b"reports_sidecar": SIDECAR_VERSION.encode(),
+        b"source_size": str(size).encode(),
+        b"source_mtime_ns": str(mtime_ns).encode(),
+        b"rows_read": str(loaded.rows_read).encode(),
+        b"column_mapping": _json.dumps([list(m) for m in loaded.mapping]).encode(),
+    }
+
+
+def read_sidecar(source: Path, size: int, mtime_ns: int) -> "LoadedReports | None":
+    side = sidecar_path(source)
+    if not side.exists():
+        return None
+    try:
+        table = feather.read_table(side, memory_map=True)
+    except Exception:
+        return None
+    meta = table.schema.metadata or {}
+    if (
+        meta.get(b"reports_sidecar") != SIDECAR_VERSION.encode()
+        or meta.get(b"source_size") != str(size).encode()
+        or meta.get(b"source_mtime_ns") != str(mtime_ns).encode()
+    ):
+        return None
+    mapping = tuple(ColumnMatch(*m) for m in _json.loads(meta.get(b"column_mapping", b"[]")))
+    return LoadedReports(table.to_pandas(), int(meta.get(b"rows_read", b"0")), mapping)
+
+
+def write_sidecar(source: Path, loaded: LoadedReports, size: int, mtime_ns: int) -> bool:
+    # Best effort: a read-only app folder just means we keep parsing the source.
+    side = sidecar_path(source)
+    tmp = side.with_name(f"{side.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")  # per writer: processes may race
+    try:
+        table = pa.Table.from_pandas(loaded.df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_sidecar_meta(size, mtime_ns, loaded)})
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, side)
+        return True
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return False
+
+
+def load_normalized_file(path: Path, size: int, mtime_ns: int) -> LoadedReports:
+    loaded = read_sidecar(path, size, mtime_ns)
+    if loaded is not None:
+        return loaded
+    loaded = normalize_reports(read_reports_file(path))
+    if loaded.df is not None:
+        write_sidecar(path, loaded, size, mtime_ns)
+    return loaded
+
+
+# -------------------- Fingerprints & process-wide cache --------------------
+def find_local_reports(here: Path) -> "Path | None":
+    if REPORTS_FILE:
+        p = Path(REPORTS_FILE)
+        return p if p.exists() else None
+    for name in REPORT_NAMES:
+        p = here / name
+        if p.exists():
+            return p
+    return None
+
+
+def file_fingerprint(path: Path) -> "tuple[str, int, int]":
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def bytes_fingerprint(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+# cache_resource rather than cache_data: full datasets would otherwise be unpickled per rerun.
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_reports_file(path: str, size: int, mtime_ns: int, full: bool = FULL_DATASET) -> LoadedReports:
+    # size/mtime_ns are part of the cache key: a changed file gets a new entry (and a new sidecar).
+    loaded = load_normalized_file(Path(path), size, mtime_ns)._replace(version=f"{path}:{size}:{mtime_ns}:{int(full)}")
+    if full or loaded.df is None:
+        return loaded
+    return loaded._replace(df=shrink_reports(loaded.df))
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_reports_upload(name: str, digest: str, _upload, full: bool = FULL_DATASET) -> LoadedReports:
+    # Keyed by content hash; _upload (the UploadedFile) is excluded from hashing (leading
+    # underscore) and only read on a cache miss.
+    return prepare_reports(read_reports_bytes(name, _upload.getvalue()), full)._replace(version=f"{digest}:{int(full)}")
+
+
+def build_sidecars(here: Path) -> "list[Path]":
+    # Used at image build time (see Dockerfile) so the first session never parses Excel.
+    built = []
+    for name in REPORT_NAMES:
+        src = here / name
+        if not src.exists():
+            continue
+        _, size, mtime_ns = file_fingerprint(src)
+        try:
+            loaded = load_normalized_file(src, size, mtime_ns)
+        except Exception as e:
+            print(f"skipped {name}: {e}", file=sys.stderr)
+            continue
+        if loaded.df is not None and sidecar_path(src).exists():
+            built.append(sidecar_path(src))
+    return built
+
+
+if __name__ == "__main__":
+    here = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent
+    for p in build_sidecars(here):
+        print(f"sidecar: {p}")
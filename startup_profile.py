@@ -0,0 +1,91 @@
+# Cold-start profile: per-import and per-section wall times for the app's first script run in
+# this process, so startup regressions can be tracked from release to release. Off unless
+# STARTUP_PROFILE is set: any value logs the report to stderr, a path ending in .json also
+# writes it there (rewritten when a later run lazily imports more modules).
+#
+#   STARTUP_PROFILE=startup.json streamlit run streamlit_app.py
+#
+# Imports are timed by wrapping builtins.__import__ for modules not loaded yet, imported
+# from this app's own files; times are inclusive, nested app imports are indented.
+
+import builtins
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+PROFILE = os.environ.get("STARTUP_PROFILE", "")
+APP_DIR = str(Path(__file__).resolve().parent)
+
+_real_import = builtins.__import__
+_imports = []   # {"module", "ms", "depth", "run"}
+_sections = []  # {"section", "ms"}
+_state = {"run": 0, "t": None, "depth": 0, "first_run_ms": None, "reported": 0}
+
+
+def _from_app(globals) -> bool:
+    path = (globals or {}).get("__file__") or ""
+    return path.startswith(APP_DIR) and "site-packages" not in path
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name in sys.modules or name.startswith("streamlit.runtime") or not _from_app(globals):
+        return _real_import(name, globals, locals, fromlist, level)
+    depth = _state["depth"]
+    _state["depth"] = depth + 1
+    t = time.perf_counter()
+    try:
+        return _real_import(name, globals, locals, fromlist, level)
+    finally:
+        _state["depth"] = depth
+        _imports.append({"module": name, "ms": round((time.perf_counter() - t) * 1000, 1),
+                         "depth": depth, "run": _state["run"]})
+
+
+if PROFILE:
+    builtins.__import__ = _timed_import
+
+
+def begin() -> None:
+    # Top of every script run; only the first run in the process gets section times.
+    _state["run"] += 1
+    _state["t"] = time.perf_counter()
+
+
+def mark(section: str) -> None:
+    # Closes a section: the time since begin() or the previous mark().
+    if not PROFILE or _state["run"] != 1:
+        return
+    t = time.perf_counter()
+    _sections.append({"section": section, "ms": round((t - _state["t"]) * 1000, 1)})
+    _state["t"] = t
+
+
+def end() -> None:
+    # Bottom of every script run: reports the first run, then any new lazy imports.
+    if not PROFILE:
+        return
+    first = _state["first_run_ms"] is None
+    if first:
+        _state["first_run_ms"] = round(sum(s["ms"] for s in _sections), 1)
+    new = _imports[_state["reported"]:]
+    if not first and not new:
+        return
+    _state["reported"] = len(_imports)
+    print(_format(new, first=first), file=sys.stderr)
+    if PROFILE.endswith(".json"):
+        Path(PROFILE).write_text(json.dumps(report(), indent=2))
+
+
+def report() -> dict:
+    return {"first_run_ms": _state["first_run_ms"], "imports": list(_imports), "sections": list(_sections)}
+
+
+def _format(imports, *, first: bool) -> str:
+    lines = [f"startup profile: first run {_state['first_run_ms']} ms" if first
+             else f"startup profile: lazy imports in run {_state['run']}"]
+    lines += [f"  import  {'  ' * i['depth']}{i['module']:<{32 - 2 * i['depth']}} {i['ms']:>8.1f} ms" for i in imports]
+    if first:
+        lines += [f"  section {s['section']:<32} {s['ms']:>8.1f} ms" for s in _sections]
+    return "\n".join(lines)
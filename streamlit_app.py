@@ -1,19 +1,26 @@
 # CloseoutSoft • WAMI Progress Dashboard (COMPACT • CLEAN HEADER • SIDEBAR FILTERS)
-# Visual/layout/theme changes only. Functionality unchanged for existing sections.
-# Submittals tab now uses Plotly Sunburst rendered via a custom HTML component for reliable click-to-filter.
+# Only the active tab renders. Register filters, the KPI cube and group sums: registers.py; demo
+# registers: synthetic.py; chart builders (imported on first use): charts.py; Reports loading:
+# reports_data.py. The Submittals tab is a fragment in submittals_tab.py; its Plotly sunburst is a
+# declared bidirectional component (submittals_component.py) whose clicks drive the cascade filters.
+
+import startup_profile  # first: STARTUP_PROFILE times the imports below
+
+startup_profile.begin()
 
 import base64
+import hashlib
 from pathlib import Path
-import json as _json
-import uuid
 
-import altair as alt  # still imported; not used in Submittals
-import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-import streamlit.components.v1 as components
+
+import registers
+import synthetic
+
+# Heavy, tab-specific modules are imported by the tab functions: charts (plotly.express) by
+# the chart tabs, submittals_tab (reports_data, pyarrow, the component) by Submittals.
+startup_profile.mark("imports")
 
 
 # -------------------- Page / Theme --------------------
@@ -24,64 +31,6 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Altair theme (safe to leave; we just don't use Altair for Submittals)
-try:
-    alt.themes.enable("none")
-    alt.data_transformers.disable_max_rows()
-    alt.renderers.set_embed_options(actions=False)
-except Exception:
-    pass
-
-# Plotly defaults
-px.defaults.template = None
-px.defaults.color_discrete_sequence = px.colors.qualitative.Pastel
-
-# Brand accents & colors
-STATUS_COLORS = {
-    "Approved": "#A3E4D7",
-    "ApprovedWithComments": "#C9E4FF",
-    "Rejected": "#FADBD8",
-    "UR": "#FDEBD0",
-    "Open": "#F9E79F",
-    "Closed": "#D7BDE2",
-}
-SOURCE_COLORS = {"AG": "#AED6F1", "CloseoutSoft": "#F5CBA7"}
-
-
-# ---------- Styling helpers ----------
-def style_fig(fig, *, height=220, showlegend=True, legend_title=" "):
-    fig.update_layout(
-        title=None,
-        legend_title_text="",
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=height,
-        font=dict(color="#0F172A", size=12),
-        title_font=dict(color="#0B1220", size=15),
-        legend=dict(
-            font=dict(size=10),
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            x=0,
-        ),
-        margin=dict(l=8, r=8, t=32, b=6),
-        showlegend=showlegend,
-    )
-    fig.update_xaxes(
-        showgrid=False,
-        tickfont=dict(size=11, color="#0F172A"),
-        title_font=dict(size=12, color="#0F172A"),
-        showline=True, linewidth=1, linecolor="#CBD5E1", zeroline=False,
-    )
-    fig.update_yaxes(
-        gridcolor="#EEF2F7",
-        tickfont=dict(size=11, color="#0F172A"),
-        title_font=dict(size=12, color="#0F172A"),
-        showline=True, linewidth=1, linecolor="#CBD5E1", zeroline=False,
-    )
-    return fig
-
 
 # ---- Global CSS (compact layout, visible dropdowns, CLEAN WHITE HEADER) ----
 st.markdown(
@@ -143,14 +92,17 @@ st.markdown(
 
   .card{ background:#FFF; border:1px solid #E6ECF4; border-radius:12px; padding:12px; box-shadow:0 1px 2px rgba(16,24,40,.04); }
 
-  [data-testid="stTabs"] [role="tablist"]{ gap:6px; border-bottom:none; flex-wrap:wrap; }
-  [data-testid="stTabs"] [role="tab"]{
-     background:#F8FAFC; color:#0F172A !important; padding:8px 12px; border-radius:10px 10px 0 0;
-     font-weight:700; border:1px solid #E6ECF4; border-bottom:none; font-size:13px;
+  /* Lazy tab strip: the "active_tab" radio drawn as tabs */
+  .st-key-active_tab [role="radiogroup"]{ gap:6px; flex-wrap:wrap; }
+  .st-key-active_tab [role="radiogroup"] > label{
+     background:#F8FAFC; padding:8px 12px; border-radius:10px 10px 0 0; margin:0;
+     border:1px solid #E6ECF4; border-bottom:none;
   }
-  [data-testid="stTabs"] [role="tab"][aria-selected="true"]{
-     background:#FFFFFF; color:#0B1220 !important; box-shadow:0 -2px 8px rgba(16,24,40,.05);
+  .st-key-active_tab [role="radiogroup"] > label > div:first-child{ display:none; }
+  .st-key-active_tab [role="radiogroup"] > label:has(input:checked){
+     background:#FFFFFF; box-shadow:0 -2px 8px rgba(16,24,40,.05);
   }
+  .st-key-active_tab [role="radiogroup"] p{ color:#0F172A !important; font-weight:700; font-size:13px; }
 
   div[data-testid="stDataFrame"]{ border:1px solid #E6ECF4; border-radius:12px; overflow:hidden; background:#FFFFFF !important; }
 
@@ -181,7 +133,19 @@ st.markdown(
 )
 
 
+startup_profile.mark("page + css")
+
+
 # -------------------- Simple Header --------------------
+# Header images are resolved once per process. Files under ./static go out as static-serving
+# URLs (app/static/<name>?v=<hash>, long-lived browser cache, a few bytes per rerun); images
+# found only next to the app, and the SVG fallback avatar, as memoized data URIs.
+APP_DIR = Path(__file__).parent if "__file__" in globals() else Path(".")
+STATIC_DIR = APP_DIR / "static"
+LOGO_NAMES = ("rebus_logo.png", "rebus.png", "rebus.jpg", "rebus.jpeg")
+PROFILE_NAMES = ("profile.jpg", "profile.png", "avatar.png", "user.png", "avatar.jpg")
+
+
 def _img_to_data_uri(path: Path) -> str | None:
     if not path or not path.exists():
         return None
@@ -189,21 +153,16 @@ def _img_to_data_uri(path: Path) -> str | None:
     return f"data:{mime};base64," + base64.b64encode(path.read_bytes()).decode("ascii")
 
 
-def _logo_data_uri() -> str | None:
-    here = Path(__file__).parent if "__file__" in globals() else Path(".")
-    for name in ("rebus_logo.png", "rebus.png", "rebus.jpg", "rebus.jpeg"):
-        uri = _img_to_data_uri(here / name)
-        if uri:
-            return uri
-    return None
-
-
-def _profile_data_uri() -> str | None:
-    here = Path(__file__).parent if "__file__" in globals() else Path(".")
-    for name in ("profile.jpg", "profile.png", "avatar.png", "user.png", "avatar.jpg"):
-        uri = _img_to_data_uri(here / name)
-        if uri:
-            return uri
+def _img_src(names) -> str | None:
+    static = st.get_option("server.enableStaticServing")
+    for folder in (STATIC_DIR, APP_DIR):
+        for name in names:
+            path = folder / name
+            if not path.is_file():
+                continue
+            if static and folder == STATIC_DIR:
+                return f"app/static/{name}?v={hashlib.sha1(path.read_bytes()).hexdigest()[:12]}"
+            return _img_to_data_uri(path)
     return None
 
 
@@ -218,9 +177,13 @@ def _actor_svg_data_uri() -> str:
     return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
 
 
-_logo = _logo_data_uri()
-_avatar = _profile_data_uri()
-_actor = _actor_svg_data_uri()
+@st.cache_resource(show_spinner=False)
+def header_images() -> tuple:
+    # (logo src or None, avatar src); a replaced image shows up after a restart.
+    return _img_src(LOGO_NAMES), _img_src(PROFILE_NAMES) or _actor_svg_data_uri()
+
+
+_logo, _avatar = header_images()
 
 st.markdown(
     f"""
@@ -230,7 +193,7 @@ st.markdown(
           {f'<img class="rebus-logo" src="{_logo}" alt="CloseoutSoft">' if _logo else ''}
         </div>
         <div class="brand-right">
-          <img class="avatar" src="{_avatar or _actor}" alt="Profile">
+          <img class="avatar" src="{_avatar}" alt="Profile">
         </div>
       </div>
     </div>
@@ -239,117 +202,15 @@ st.markdown(
 )
 
 
+startup_profile.mark("header")
+
+
 # -------------------- Helpers --------------------
 def pct(num, den):
     return float(num) / float(den) * 100 if den else 0.0
 
 
-def safe_sum(df, col):
-    return int(df[col].sum()) if isinstance(df, pd.DataFrame) and col in df.columns else 0
-
-
-# -------------------- Demo Mock Data (unchanged sections) --------------------
-def mock_materials(seed=1):
-    np.random.seed(seed)
-    rng = pd.date_range("2025-02-01", periods=45, freq="2D")
-    discs = ["Architectural", "Civil", "Controls", "ELV", "Electrical"]
-    rows = []
-    for d in discs:
-        for dt in rng:
-            total = np.random.randint(2, 16)
-            ap = max(0, total - np.random.randint(0, 4))
-            rj = np.random.randint(0, min(3, total - ap) + 1)
-            ur = max(0, total - ap - rj)
-            rows.append(
-                dict(
-                    Date=dt,
-                    Discipline=d,
-                    Submitted=total,
-                    Approved=ap,
-                    Rejected=rj,
-                    UR=ur,
-                    Source=np.random.choice(["AG", "CloseoutSoft"]),
-                )
-            )
-    return pd.DataFrame(rows)
-
-
-def mock_drawings(seed=2):
-    np.random.seed(seed)
-    rng = pd.date_range("2025-02-01", periods=40, freq="3D")
-    discs = ["Architectural", "Civil", "Controls", "ELV", "Electrical"]
-    rows = []
-    for d in discs:
-        for dt in rng:
-            total = np.random.randint(1, 12)
-            ap = max(0, total - np.random.randint(0, 3))
-            ac = np.random.randint(0, min(3, total - ap) + 1)
-            rj = np.random.randint(0, min(2, total - ap - ac) + 1)
-            ur = max(0, total - ap - ac - rj)
-            rows.append(
-                dict(
-                    Date=dt,
-                    Discipline=d,
-                    Submitted=total,
-                    Approved=ap,
-                    ApprovedWithComments=ac,
-                    Rejected=rj,
-                    UR=ur,
-                    Source=np.random.choice(["AG", "CloseoutSoft"]),
-                )
-            )
-    return pd.DataFrame(rows)
-
-
-def mock_ncr(seed=3):
-    np.random.seed(seed)
-    rng = pd.date_range("2025-02-01", periods=70, freq="D")
-    return pd.DataFrame(
-        {
-            "Date": np.random.choice(rng, 150),
-            "Discipline": np.random.choice(
-                ["Architectural", "Civil", "Controls", "ELV", "Electrical"], 150
-            ),
-            "Status": np.random.choice(["Open", "Closed"], 150, p=[0.45, 0.55]),
-            "Severity": np.random.choice(["Low", "Medium", "High"], 150, p=[0.4, 0.45, 0.15]),
-            "Source": np.random.choice(["AG", "CloseoutSoft"], 150),
-        }
-    )
-
-
-def mock_wir(seed=4):
-    np.random.seed(seed)
-    rng = pd.date_range("2025-02-01", periods=90, freq="D")
-    return pd.DataFrame(
-        {
-            "Date": np.random.choice(rng, 160),
-            "Discipline": np.random.choice(
-                ["Architectural", "Civil", "Controls", "ELV", "Electrical"], 160
-            ),
-            "Approved": np.random.choice([0, 1], 160, p=[0.1, 0.9]),
-            "Source": np.random.choice(["AG", "CloseoutSoft"], 160),
-        }
-    )
-
-
-def mock_ms(seed=5):
-    np.random.seed(seed)
-    rng = pd.date_range("2025-02-01", periods=60, freq="2D")
-    return pd.DataFrame(
-        {
-            "Date": np.random.choice(rng, 120),
-            "Discipline": np.random.choice(
-                ["Architectural", "Civil", "Controls", "ELV", "Electrical"], 120
-            ),
-            "Submitted": np.random.randint(0, 6, 120),
-            "Approved": np.random.randint(0, 6, 120),
-            "Rejected": np.random.randint(0, 3, 120),
-            "UR": np.random.randint(0, 3, 120),
-            "Source": np.random.choice(["AG", "CloseoutSoft"], 120),
-        }
-    )
-
-
+# -------------------- Demo Mock Data (static tables) --------------------
 def mock_milestones():
     return pd.DataFrame(
         [
@@ -370,14 +231,22 @@ def mock_site_visits():
 
 
 # -------------------- Load Demo Data --------------------
-materials = mock_materials()
-drawings = mock_drawings()
-ncrs = mock_ncr()
-wir = mock_wir()
-ms = mock_ms()
+# Registers come from the synthetic factory (synthetic.py), cached per (seed, scale);
+# DEMO_SEED / DEMO_SCALE pick them, e.g. DEMO_SCALE=1e6 for a million rows per register.
+demo = synthetic.demo_registers(synthetic.DEMO_SEED, synthetic.DEMO_SCALE)
+materials, drawings, ncrs, wir, ms = (demo[name] for name in synthetic.REGISTER_NAMES)
 milestones = mock_milestones()
 sitevisits = mock_site_visits()
 
+# Content versions for the per-register caches (filter index, KPI cube, group sums).
+materials_v, drawings_v, ncrs_v, ms_v = (
+    synthetic.register_version(name, synthetic.DEMO_SEED, synthetic.DEMO_SCALE)
+    for name in ("materials", "drawings", "ncrs", "ms")
+)
+
+
+startup_profile.mark("demo data")
+
 
 # -------------------- Sidebar Filters --------------------
 def multiselect_with_all(label: str, options: list[str], *, default_all=True, key: str = "ms"):
@@ -444,33 +313,71 @@ else:
     start_date, end_date = st.sidebar.date_input("Date Range", (today, today), disabled=True)
 
 
+startup_profile.mark("sidebar filters")
+
+
 # -------------------- Apply filters --------------------
-def apply_filters(df):
+filter_isin = {}
+if src_filter:
+    filter_isin["Source"] = src_filter
+if sel_disc:
+    filter_isin["Discipline"] = sel_disc
+filter_dates = (pd.to_datetime(start_date), pd.to_datetime(end_date))
+
+
+def apply_filters(df, *, version: str = ""):
+    # Bitmap/sorted-date index per register (cached by version); returns df itself when
+    # nothing is filtered out, otherwise a take() of the matching rows. Never mutate the result.
     if df is None or df.empty:
         return df
-    out = df.copy()
-    if "Source" in out.columns and src_filter:
-        out = out[out["Source"].isin(src_filter)]
-    if "Date" in out.columns:
-        out = out[(out["Date"] >= pd.to_datetime(start_date)) & (out["Date"] <= pd.to_datetime(end_date))]
-    if sel_disc and "Discipline" in out.columns:
-        out = out[out["Discipline"].isin(sel_disc)]
-    return out
+    index = registers.filter_index(version, df) if version else registers.build_filter_index(df)
+    rows = registers.select_rows(index, filter_isin, filter_dates)
+    return df if rows is None else df.take(rows)
+
 
+def kpi_totals(df, *, version: str) -> dict:
+    # Filtered measure totals from the register's pre-aggregated KPI cube.
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return {}
+    return registers.cube_totals(registers.kpi_cube(version, df), filter_isin, filter_dates)
 
-f_mats = apply_filters(materials)
-f_dwgs = apply_filters(drawings)
-f_ncrs = apply_filters(ncrs)
-f_wir = apply_filters(wir)
-f_ms = apply_filters(ms)
+
+REGISTERS = {
+    "materials": (materials, materials_v),
+    "drawings": (drawings, drawings_v),
+    "ncrs": (ncrs, ncrs_v),
+    "ms": (ms, ms_v),
+}
+_filtered = {}
+
+
+def filtered(name: str):
+    # Filtered register, built on first use in this run; only the active tab asks for it.
+    if name not in _filtered:
+        df, version = REGISTERS[name]
+        _filtered[name] = apply_filters(df, version=version)
+    return _filtered[name]
+
+
+filters_key = registers.filter_key(filter_isin, filter_dates)
+
+
+def register_sums(name: str, by: str, measures) -> registers.GroupSums:
+    # Per-Discipline / per-Source sums under the sidebar filters, shared by every tab
+    # (memoized per register version + grouping + filter state, see registers.group_sums).
+    df, version = REGISTERS[name]
+    return registers.group_sums(version, df, by, tuple(measures), filters_key)
 
 
 # -------------------- KPI CARDS --------------------
-m_total, m_approved = safe_sum(f_mats, "Submitted"), safe_sum(f_mats, "Approved")
-d_total, d_approved = safe_sum(f_dwgs, "Submitted"), safe_sum(f_dwgs, "Approved")
-n_total = int(len(f_ncrs)) if isinstance(f_ncrs, pd.DataFrame) else 0
-n_closed = int((f_ncrs["Status"] == "Closed").sum()) if isinstance(f_ncrs, pd.DataFrame) and "Status" in f_ncrs else 0
-ms_total, ms_approved = safe_sum(f_ms, "Submitted"), safe_sum(f_ms, "Approved")
+k_mats = kpi_totals(materials, version=materials_v)
+k_dwgs = kpi_totals(drawings, version=drawings_v)
+k_ncrs = kpi_totals(ncrs, version=ncrs_v)
+k_ms = kpi_totals(ms, version=ms_v)
+m_total, m_approved = k_mats.get("Submitted", 0), k_mats.get("Approved", 0)
+d_total, d_approved = k_dwgs.get("Submitted", 0), k_dwgs.get("Approved", 0)
+n_total, n_closed = k_ncrs.get("Rows", 0), k_ncrs.get("Closed", 0)
+ms_total, ms_approved = k_ms.get("Submitted", 0), k_ms.get("Approved", 0)
 hri = (
     0.4 * pct(m_approved, m_total)
     + 0.3 * pct(d_approved, d_total)
@@ -517,47 +424,52 @@ def render_kpi_cards():
 
 
 render_kpi_cards()
+startup_profile.mark("kpi cards")
+
+
+# -------------------- Tabs (lazy) --------------------
+# st.tabs runs and serializes every tab body on each rerun. A tab-styled radio picks the
+# active tab and only its function runs (see the dispatch at the end of the file); the
+# others cost nothing until selected, and the caches they read (filter index, KPI cube,
+# reports payload) stay warm in the meantime.
+TAB_NAMES = [
+    "Overview",
+    "Project Details",
+    "Milestones",
+    "Constraints",
+    "Achievements",
+    "Recommendations",
+    "AG Summary",
+    "CloseoutSoft Summary",
+    "AG vs CloseoutSoft",
+    "General Notes",
+    "Handover Strategy",
+    "Addendum: Site Visits",
+    "Submittals",
+]
+# Streamlit drops a widget's state on runs where it isn't rendered; re-assigning keeps the
+# Submittals selections across visits to other tabs.
+for _k in ("activity_select", "subm_disc", "subm_sys", "subm_sub", "subm_client_cascade"):
+    if _k in st.session_state:
+        st.session_state[_k] = st.session_state[_k]
 
-
-# -------------------- Tabs --------------------
-tabs = st.tabs(
-    [
-        "Overview",
-        "Project Details",
-        "Milestones",
-        "Constraints",
-        "Achievements",
-        "Recommendations",
-        "AG Summary",
-        "CloseoutSoft Summary",
-        "AG vs CloseoutSoft",
-        "General Notes",
-        "Handover Strategy",
-        "Addendum: Site Visits",
-        "Submittals",
-    ]
-)
+active_tab = st.radio("Tab", TAB_NAMES, horizontal=True, key="active_tab", label_visibility="collapsed")
 
 # =============== Overview ===============
-with tabs[0]:
+def tab_overview():
+    from charts import STATUS_COLORS, px, style_fig
+
+    f_ncrs = filtered("ncrs")
     t1, t2 = st.columns(2)
     b1, b2 = st.columns(2)
 
     with t1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Materials – Status by Discipline**")
-        if isinstance(f_mats, pd.DataFrame) and not f_mats.empty:
-            df = f_mats.groupby("Discipline")[["Approved", "Rejected", "UR"]].sum().reset_index()
-            long = df.melt(
-                id_vars="Discipline",
-                value_vars=["Approved", "Rejected", "UR"],
-                var_name="Status",
-                value_name="Count",
-            )
-            long["Status"] = long["Status"].fillna("(Blank)")
-            long["Discipline"] = long["Discipline"].fillna("(Blank)")
+        agg = register_sums("materials", "Discipline", ["Approved", "Rejected", "UR"])
+        if agg.rows:
             fig = px.bar(
-                long, x="Discipline", y="Count", color="Status", barmode="stack",
+                agg.long, x="Discipline", y="Count", color="Status", barmode="stack",
                 color_discrete_map=STATUS_COLORS, template=None
             )
             st.plotly_chart(style_fig(fig, height=240), use_container_width=True)
@@ -569,10 +481,13 @@ with tabs[0]:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**NCR Status**")
         if isinstance(f_ncrs, pd.DataFrame) and not f_ncrs.empty and "Status" in f_ncrs.columns:
-            tmp = f_ncrs.copy()
-            tmp["Status"] = tmp["Status"].fillna("(Blank)")
+            # one slice per status, not one pie entry per NCR row
+            counts = f_ncrs["Status"].value_counts(dropna=False)
+            counts = counts[counts > 0]  # categorical: no slices for unused categories
+            counts.index = counts.index.astype(object).fillna("(Blank)")
+            counts = counts.rename_axis("Status").reset_index(name="Count")
             fig = px.pie(
-                tmp, names="Status", hole=0.55, color="Status",
+                counts, names="Status", values="Count", hole=0.55, color="Status",
                 color_discrete_map=STATUS_COLORS, template=None
             )
             fig.update_traces(textinfo="percent", textposition="inside")
@@ -586,22 +501,10 @@ with tabs[0]:
     with b1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Shop Drawings – Status by Discipline**")
-        if isinstance(f_dwgs, pd.DataFrame) and not f_dwgs.empty:
-            df = (
-                f_dwgs.groupby("Discipline")[["Approved", "ApprovedWithComments", "Rejected", "UR"]]
-                .sum()
-                .reset_index()
-            )
-            long = df.melt(
-                id_vars="Discipline",
-                value_vars=["Approved", "ApprovedWithComments", "Rejected", "UR"],
-                var_name="Status",
-                value_name="Count",
-            )
-            long["Status"] = long["Status"].fillna("(Blank)")
-            long["Discipline"] = long["Discipline"].fillna("(Blank)")
+        agg = register_sums("drawings", "Discipline", ["Approved", "ApprovedWithComments", "Rejected", "UR"])
+        if agg.rows:
             fig = px.bar(
-                long, x="Discipline", y="Count", color="Status", barmode="stack",
+                agg.long, x="Discipline", y="Count", color="Status", barmode="stack",
                 color_discrete_map=STATUS_COLORS, template=None
             )
             st.plotly_chart(style_fig(fig, height=240), use_container_width=True)
@@ -612,18 +515,10 @@ with tabs[0]:
     with b2:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**CloseoutSoft – Material Inspections**")
-        if isinstance(f_ms, pd.DataFrame) and not f_ms.empty:
-            grp = f_ms.groupby("Discipline")[["Approved", "Rejected", "UR"]].sum().reset_index()
-            long = grp.melt(
-                id_vars="Discipline",
-                value_vars=["Approved", "Rejected", "UR"],
-                var_name="Status",
-                value_name="Count",
-            )
-            long["Status"] = long["Status"].fillna("(Blank)")
-            long["Discipline"] = long["Discipline"].fillna("(Blank)")
+        agg = register_sums("ms", "Discipline", ["Approved", "Rejected", "UR"])
+        if agg.rows:
             fig = px.bar(
-                long, x="Discipline", y="Count", color="Status", barmode="stack",
+                agg.long, x="Discipline", y="Count", color="Status", barmode="stack",
                 color_discrete_map=STATUS_COLORS, template=None,
             )
             st.plotly_chart(style_fig(fig, height=240), use_container_width=True)
@@ -633,7 +528,7 @@ with tabs[0]:
 
 
 # =============== Project Details ===============
-with tabs[1]:
+def tab_project_details():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown("### Project Details")
     details = pd.DataFrame(
@@ -651,13 +546,13 @@ with tabs[1]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Milestones ===============
-with tabs[2]:
+def tab_milestones():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.dataframe(milestones, use_container_width=True, hide_index=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Constraints ===============
-with tabs[3]:
+def tab_constraints():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown(
         """
@@ -671,7 +566,7 @@ with tabs[3]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Achievements ===============
-with tabs[4]:
+def tab_achievements():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown(
         """
@@ -684,7 +579,7 @@ with tabs[4]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Recommendations ===============
-with tabs[5]:
+def tab_recommendations():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown(
         """
@@ -697,55 +592,54 @@ with tabs[5]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== AG Summary ===============
-with tabs[6]:
+def tab_ag_summary():
     c1, c2 = st.columns(2)
     with c1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Material Submissions Summary**")
-        if isinstance(f_mats, pd.DataFrame) and not f_mats.empty:
-            grp = f_mats.groupby("Discipline")[["Submitted", "Approved", "Rejected", "UR"]].sum().reset_index()
-            st.dataframe(grp, use_container_width=True, hide_index=True)
+        agg = register_sums("materials", "Discipline", ["Submitted", "Approved", "Rejected", "UR"])
+        if agg.rows:
+            st.dataframe(agg.wide, use_container_width=True, hide_index=True)
         else:
             st.caption("No data.")
         st.markdown("</div>", unsafe_allow_html=True)
     with c2:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Shop Drawings Summary**")
-        if isinstance(f_dwgs, pd.DataFrame) and not f_dwgs.empty:
-            grp = (
-                f_dwgs.groupby("Discipline")[["Submitted", "Approved", "ApprovedWithComments", "Rejected", "UR"]]
-                .sum()
-                .reset_index()
-            )
-            st.dataframe(grp, use_container_width=True, hide_index=True)
+        agg = register_sums("drawings", "Discipline", ["Submitted", "Approved", "ApprovedWithComments", "Rejected", "UR"])
+        if agg.rows:
+            st.dataframe(agg.wide, use_container_width=True, hide_index=True)
         else:
             st.caption("No data.")
         st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== CloseoutSoft Summary ===============
-with tabs[7]:
+def tab_closeoutsoft_summary():
     c1, c2 = st.columns(2)
     with c1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Material Inspection Requests**")
-        if isinstance(f_ms, pd.DataFrame) and not f_ms.empty:
-            mir = f_ms.groupby("Discipline")[["Submitted", "Approved", "Rejected", "UR"]].sum().reset_index()
-            st.dataframe(mir, use_container_width=True, hide_index=True)
+        agg = register_sums("ms", "Discipline", ["Submitted", "Approved", "Rejected", "UR"])
+        if agg.rows:
+            st.dataframe(agg.wide, use_container_width=True, hide_index=True)
         else:
             st.caption("No data.")
         st.markdown("</div>", unsafe_allow_html=True)
     with c2:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown("**Material Submissions**")
-        if isinstance(f_mats, pd.DataFrame) and not f_mats.empty:
-            grp = f_mats.groupby("Discipline")[["Submitted", "Approved", "Rejected", "UR"]].sum().reset_index()
-            st.dataframe(grp, use_container_width=True, hide_index=True)
+        # same result object as the AG Summary table
+        agg = register_sums("materials", "Discipline", ["Submitted", "Approved", "Rejected", "UR"])
+        if agg.rows:
+            st.dataframe(agg.wide, use_container_width=True, hide_index=True)
         else:
             st.caption("No data.")
         st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== AG vs CloseoutSoft ===============
-with tabs[8]:
+def tab_comparison():
+    from charts import SOURCE_COLORS, px, style_fig
+
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown("### AG vs CloseoutSoft – Comparison")
     st.markdown(
@@ -755,21 +649,15 @@ with tabs[8]:
 - Missing in AG: **WIR**, **Progress S-Curve**, **O&M Manuals**, **Spares**, **Snag/Punch List**
 """
     )
-    if (
-        isinstance(f_mats, pd.DataFrame)
-        and isinstance(f_dwgs, pd.DataFrame)
-        and not f_mats.empty
-        and not f_dwgs.empty
-        and "Source" in f_mats.columns
-        and "Source" in f_dwgs.columns
-        and "Submitted" in f_mats.columns
-        and "Submitted" in f_dwgs.columns
-    ):
-        agg_a = f_mats.groupby(["Source"]).agg({"Submitted": "sum"}).reset_index()
-        agg_b = f_dwgs.groupby(["Source"]).agg({"Submitted": "sum"}).reset_index()
-        agg_a["Register"] = "Materials"
-        agg_b["Register"] = "Drawings"
-        comp = pd.concat([agg_a, agg_b], ignore_index=True)
+    mats, dwgs = REGISTERS["materials"][0], REGISTERS["drawings"][0]
+    has_cols = all({"Source", "Submitted"} <= set(df.columns) for df in (mats, dwgs))
+    agg_a = register_sums("materials", "Source", ["Submitted"]) if has_cols else None
+    agg_b = register_sums("drawings", "Source", ["Submitted"]) if has_cols else None
+    if has_cols and agg_a.rows and agg_b.rows:
+        comp = pd.concat(
+            [agg_a.wide.assign(Register="Materials"), agg_b.wide.assign(Register="Drawings")],
+            ignore_index=True,
+        )
         fig = px.bar(comp, x="Register", y="Submitted", color="Source", barmode="group",
                      color_discrete_map=SOURCE_COLORS, template=None)
         st.plotly_chart(style_fig(fig, height=230), use_container_width=True)
@@ -778,7 +666,7 @@ with tabs[8]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== General Notes ===============
-with tabs[9]:
+def tab_general_notes():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown(
         """
@@ -791,7 +679,7 @@ with tabs[9]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Handover Strategy ===============
-with tabs[10]:
+def tab_handover():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown("### Handover Strategy")
     st.markdown(
@@ -805,392 +693,26 @@ with tabs[10]:
     st.markdown("</div>", unsafe_allow_html=True)
 
 # =============== Site Visits ===============
-with tabs[11]:
+def tab_site_visits():
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown("### Site Visit Details")
     st.dataframe(sitevisits, use_container_width=True, hide_index=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-# =============== Submittals (Plotly Sunburst via HTML + click-to-filter) ===============
-def load_reports_df() -> "pd.DataFrame | None":
-    """
-    Load Reports.json / Reports.xlsx from the app folder OR from a user upload.
-    Also shrinks very large datasets for cloud rendering.
-    """
-    import re
-
-    def _norm(s: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", s.lower())
-
-    def _auto_map_columns(df: pd.DataFrame) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-        norm_to_real = {_norm(c): c for c in df.columns}
-        wants = {
-            "Discipline": ["discipline", "trade", "division", "disciplinename"],
-            "System": ["system", "systemname", "systems"],
-            "Subsystem": ["subsystem", "subsystemname", "sub_system", "sub-system", "subsystemdesc", "subsystemdescription", "subsystemtype"],
-            "Status": ["status", "submittalstatus", "state", "stage", "approvalstatus"],
-            "Activity": ["activity", "activitytype", "register", "category"],
-            "SubmittalDate": ["submittaldate", "date", "submittedon"],
-            "InternalRefNumber": ["internalrefnumber", "refno", "internalref", "reference", "referenceid"],
-            "Company": ["createdcompanyname", "company", "createdbycompany", "originatorcompany"],
-            "Building": ["building", "buildingname"],
-            "Level": ["level", "floor", "storey"],
-            "Room": ["room", "roomname"],
-        }
-        rename = {}
-        for target, cands in wants.items():
-            found = None
-            for cand in cands:
-                for norm_col, real_col in norm_to_real.items():
-                    if norm_col == cand or cand in norm_col:
-                        found = real_col
-                        break
-                if found:
-                    break
-            if found:
-                rename[found] = target
-        if rename:
-            df = df.rename(columns=rename)
-        keep = [
-            "Discipline","System","Subsystem","Status","Activity",
-            "SubmittalDate","InternalRefNumber","Company","Building","Level","Room",
-        ]
-        df = df[[c for c in keep if c in df.columns]].copy()
-        return df
+# =============== Submittals (submittals_tab.py) ===============
+def tab_submittals():
+    import submittals_tab
 
-    # 1) Try local files
-    here = Path(__file__).parent if "__file__" in globals() else Path(".")
-    discovered, found_name = None, None
-    for name in ("Reports.json", "Reports.xlsx"):
-        p = here / name
-        if p.exists():
-            try:
-                if p.suffix.lower() == ".json":
-                    with p.open("r", encoding="utf-8") as f:
-                        j = _json.load(f)
-                    if isinstance(j, list):
-                        discovered = pd.DataFrame(j)
-                    elif isinstance(j, dict):
-                        list_key = next((k for k, v in j.items() if isinstance(v, list)), None)
-                        discovered = pd.DataFrame(j[list_key]) if list_key else pd.json_normalize(j)
-                    else:
-                        discovered = pd.read_json(p)
-                else:
-                    discovered = pd.read_excel(p, sheet_name=0)
-                found_name = name
-            except Exception as e:
-                st.warning(f"Found {name} but failed to read it: {e}")
-                discovered = None
-            break
-
-    # 2) Uploader (always visible)
-    uploaded = st.file_uploader(
-        "Report Inputs",
-        type=["json", "xlsx"],
-        key="reports_uploader",
-        accept_multiple_files=False,
-        help="Upload Reports.json or Reports.xlsx. If present locally next to the app, it will be picked up automatically.",
-    )
+    submittals_tab.render()
 
-    df, src = None, None
-    if uploaded is not None:
-        try:
-            if uploaded.name.lower().endswith(".json"):
-                j = _json.loads(uploaded.read().decode("utf-8"))
-                if isinstance(j, list):
-                    df = pd.DataFrame(j)
-                elif isinstance(j, dict):
-                    list_key = next((k for k, v in j.items() if isinstance(v, list)), None)
-                    df = pd.DataFrame(j[list_key]) if list_key else pd.json_normalize(j)
-                else:
-                    df = pd.read_json(uploaded)
-                src = f"uploaded file ({uploaded.name})"
-            else:
-                df = pd.read_excel(uploaded)
-                src = f"uploaded file ({uploaded.name})"
-        except Exception as e:
-            st.error(f"Could not read uploaded file: {e}")
-            df = None
 
-    if df is None:
-        df = discovered
-        if discovered is not None:
-            src = f"local file ({found_name})"
-
-    if df is None or df.empty:
-        st.info("Place **Reports.json** or **Reports.xlsx** next to `streamlit_app.py`, or use the **Report Inputs** control above.")
-        return None
-
-    # Auto-map & validate
-    df = _auto_map_columns(df)
-    if df is None or df.empty or "Discipline" not in df.columns or "System" not in df.columns:
-        st.error("Reports file loaded, but required columns not found. Expect **Discipline, System** (plus Subsystem/Status/Activity if available).")
-        return None
-
-    # ---- Shrink data for cloud rendering ----
-    orig_len = len(df)
-    if "SubmittalDate" in df.columns:
-        df["SubmittalDate"] = pd.to_datetime(df["SubmittalDate"], errors="coerce")
-        if df["SubmittalDate"].notna().any():
-            cutoff = df["SubmittalDate"].max() - pd.DateOffset(months=24)
-            recent = df[df["SubmittalDate"] >= cutoff]
-            if len(recent) >= 1000:
-                df = recent
-
-    MAX_ROWS = 5000
-    if len(df) > MAX_ROWS:
-        sort_col = "SubmittalDate" if "SubmittalDate" in df.columns else None
-        if sort_col:
-            df = df.sort_values(sort_col, ascending=False).head(MAX_ROWS).copy()
-        else:
-            df = df.head(MAX_ROWS).copy()
-
-    with st.expander("REPORTS DATA", expanded=False):
-        st.write(f"Source: **{src or 'unknown'}**")
-        st.write(f"Rows used for charts: **{len(df)}**  (from original **{orig_len}**)")
-        st.write("Columns:", list(df.columns))
-        st.dataframe(df.head(20), use_container_width=True, hide_index=True)
-
-    return df
-
-
-# ----- NEW: single HTML component that draws sunburst + handles table filtering on click (client-side only) -----
-def _sunburst_with_table_html(df_f: pd.DataFrame, *, height: int = 560):
-    import json as _json
-    import uuid
-
-    df_f = pd.DataFrame(df_f).copy()
-    for c in ("Discipline", "System", "Subsystem", "Status", "Activity",
-              "InternalRefNumber", "Company", "Building", "Level", "Room"):
-        if c in df_f.columns:
-            df_f[c] = df_f[c].fillna("—").astype(str)
-
-    if "SubmittalDate" in df_f.columns:
-        df_f["SubmittalDate"] = pd.to_datetime(df_f["SubmittalDate"], errors="coerce")\
-                                   .dt.strftime("%Y-%m-%d %H:%M").fillna("")
-
-    cols_pref = ["Discipline","System","Subsystem","Status","SubmittalDate","InternalRefNumber","Company","Building"]
-    cols = [c for c in cols_pref if c in df_f.columns]
-    records = df_f[cols].to_dict(orient="records")
-
-    DELIM = "|||"; ROOT = "ROOT"
-    gcols = [c for c in ["Discipline","System","Subsystem"] if c in df_f.columns]
-    rows = [{"id": ROOT, "label": "All", "parent": "", "Count": int(len(df_f))}]
-
-    if gcols:
-        lvl1 = df_f.groupby([gcols[0]], dropna=False).size().reset_index(name="Count")
-        for _, r in lvl1.iterrows():
-            disc = str(r[gcols[0]])
-            rows.append({"id": disc, "label": disc, "parent": ROOT, "Count": int(r["Count"])})
-        if len(gcols) > 1:
-            lvl2 = df_f.groupby(gcols[:2], dropna=False).size().reset_index(name="Count")
-            for _, r in lvl2.iterrows():
-                disc = str(r[gcols[0]]); sys = str(r[gcols[1]])
-                rows.append({"id": DELIM.join([disc, sys]), "label": sys, "parent": disc, "Count": int(r["Count"])})
-        if len(gcols) > 2:
-            lvl3 = df_f.groupby(gcols[:3], dropna=False).size().reset_index(name="Count")
-            for _, r in lvl3.iterrows():
-                disc = str(r[gcols[0]]); sys = str(r[gcols[1]]); sub = str(r[gcols[2]])
-                rows.append({
-                    "id": DELIM.join([disc, sys, sub]),
-                    "label": sub,
-                    "parent": DELIM.join([disc, sys]),
-                    "Count": int(r["Count"])}
-                )
-
-    sun = pd.DataFrame(rows)
-    js_ids     = _json.dumps(sun["id"].tolist())
-    js_labels  = _json.dumps(sun["label"].tolist())
-    js_parents = _json.dumps(sun["parent"].tolist())
-    js_values  = _json.dumps(sun["Count"].tolist())
-    js_cols    = _json.dumps(cols)
-    js_rows    = _json.dumps(records)
-
-    dom = f"sb-{uuid.uuid4().hex[:8]}"
-    _html = f"""
-<div id="{dom}" style="width:100%;font:13px/1.4 -apple-system,BlinkMacSystemFont,Segoe UI,Roboto,Inter,Arial;">
-  <!-- No extra 'Submittals' title here to avoid duplication -->
-  <div style="display:flex;align-items:center;gap:.5rem;margin:2px 0 8px 0;">
-    <span id="{dom}-badge" style="background:#eef2f7;border:1px solid #e6ecf4;border-radius:9999px;padding:2px 8px;font-size:12px;">All</span>
-  </div>
-  <div id="{dom}-chart" style="width:100%;height:{height-220}px;"></div>
-  <div style="margin-top:8px;border:1px solid #e6ecf4;border-radius:12px;overflow:hidden;">
-    <table id="{dom}-table" style="width:100%;border-collapse:collapse;border-spacing:0;">
-      <thead style="background:#f8fafc;"><tr id="{dom}-thead"></tr></thead>
-      <tbody id="{dom}-tbody"></tbody>
-    </table>
-  </div>
-  <div id="{dom}-meta" style="margin-top:6px;color:#64748b;font-size:10px;"></div>
-</div>
-<script src="https://cdn.plot.ly/plotly-2.32.0.min.js"></script>
-<script>
-(function(){{
-  const DELIM="{DELIM}", ROOT="{ROOT}";
-  const ids={js_ids}, labels={js_labels}, parents={js_parents}, values={js_values};
-  const COLS={js_cols}, ROWS={js_rows};
-  const chartEl=document.getElementById("{dom}-chart");
-  const badgeEl=document.getElementById("{dom}-badge");
-  const metaEl=document.getElementById("{dom}-meta");
-  const thead=document.getElementById("{dom}-thead");
-  const tbody=document.getElementById("{dom}-tbody");
-
-  thead.innerHTML = COLS.map(c => `<th style="text-align:left;padding:10px 12px;border-bottom:1px solid #e6ecf4;color:#0f172a;font-weight:700;">${{c}}</th>`).join("");
-
-  function renderTable(rows){{
-    const MAX=2000; const r=rows.slice(0,MAX);
-    tbody.innerHTML = r.map(obj => `<tr>`+COLS.map(c=>`<td style="padding:8px 12px;border-bottom:1px solid #eef2f7;">${{obj[c]??""}}</td>`).join("")+`</tr>`).join("");
-    metaEl.textContent = `Showing ${{r.length}} of ${{rows.length}} row(s).`;
-    if (window.Streamlit && window.Streamlit.setFrameHeight) {{
-      window.Streamlit.setFrameHeight(document.documentElement.scrollHeight);
-    }}
-  }}
-  function filterRows(id){{
-    if (!id || id===ROOT) {{ badgeEl.textContent="All"; renderTable(ROWS); return; }}
-    const parts=id.split(DELIM);
-    let filtered=ROWS;
-    if (parts[0]) filtered=filtered.filter(x=>x["Discipline"]===parts[0]);
-    if (parts[1]) filtered=filtered.filter(x=>x["System"]===parts[1]);
-    if (parts[2]) filtered=filtered.filter(x=>x["Subsystem"]===parts[2]);
-    badgeEl.textContent=parts.join(" > ");
-    renderTable(filtered);
-  }}
-  renderTable(ROWS);
-  const data=[{{type:"sunburst",ids:ids,labels:labels,parents:parents,values:values,
-                 branchvalues:"total",maxdepth:3,
-                 hovertemplate:"%{{label}}<br>%{{value}} items<extra></extra>"}}];
-  const layout={{margin:{{l:4,r:4,t:4,b:4}},paper_bgcolor:"#fff",plot_bgcolor:"#fff"}};
-  const config={{displaylogo:false,responsive:true}};
-  Plotly.newPlot(chartEl,data,layout,config);
-  chartEl.on("plotly_click", ev => {{
-    const id = String(ev?.points?.[0]?.id || ROOT);
-    filterRows(id);
-  }});
-}})();
-</script>
-"""
-    return components.html(_html, height=height, scrolling=True)
-
-def build_submittals_plotly(df: pd.DataFrame):
-    df = pd.DataFrame(df)
-    for col in ("Discipline","System","Subsystem","Status","Activity"):
-        if col in df.columns:
-            df[col] = df[col].fillna("—").astype(str)
-
-    # --- NEW: one-time init for this tab (enforce '(All)' on first load) ---
-    if "subm_initialized" not in st.session_state:
-        st.session_state["subm_disc"] = "(All)"
-        st.session_state["subm_sys"]  = "(All)"
-        st.session_state["subm_sub"]  = "(All)"
-        st.session_state["subm_initialized"] = True
-
-    # --- existing: handle reset BEFORE widgets are created ---
-    if st.session_state.get("reset_submittals", False):
-        st.session_state.update({
-            "subm_disc": "(All)",
-            "subm_sys":  "(All)",
-            "subm_sub":  "(All)",
-            "reset_submittals": False,
-        })
-        st.rerun()
-
-    # Minimal CSS for the title & activity pill
-    st.markdown("""
-    <style>
-      .subm-title{font-size:16px;font-weight:700;margin:0;}
-      .subm-pill{
-        display:inline-block;margin:6px 0 10px 0;padding:4px 10px;font-size:12px;
-        background:#EEF2F7;color:#0F172A;border:1px solid #E6ECF4;border-radius:9999px;
-      }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # ---------------- Sidebar: Title + Clear (link) ----------------
-    sb1, sb2 = st.sidebar.columns([4, 1])
-    with sb1:
-        st.markdown('<div class="subm-title">Submittals</div>', unsafe_allow_html=True)
-    with sb2:
-        if st.sidebar.button("Clear", key="subm_clear_sb", help="Reset all to (All)"):
-            st.session_state["reset_submittals"] = True
-            st.rerun()
-
-    # ---- helper ----
-    def _safe_index(val, options): return options.index(val) if val in options else 0
-
-    # ---- Discipline ----
-    disc_opts = ["(All)"] + (sorted(df["Discipline"].unique()) if "Discipline" in df.columns else [])
-    if st.session_state.get("subm_disc") not in disc_opts:
-        st.session_state["subm_disc"] = "(All)"
-    sel_disc = st.sidebar.selectbox(
-        "Discipline",
-        disc_opts,
-        index=_safe_index(st.session_state.get("subm_disc", "(All)"), disc_opts),
-        key="subm_disc",
-    )
-    df1 = df if sel_disc == "(All)" or "Discipline" not in df.columns else df[df["Discipline"] == sel_disc]
-
-    # ---- System (depends on Discipline) ----
-    sys_opts = ["(All)"] + (sorted(df1["System"].unique()) if "System" in df1.columns else [])
-    if st.session_state.get("subm_sys") not in sys_opts:
-        st.session_state["subm_sys"] = "(All)"
-    sel_sys = st.sidebar.selectbox(
-        "System",
-        sys_opts,
-        index=_safe_index(st.session_state.get("subm_sys", "(All)"), sys_opts),
-        key="subm_sys",
-    )
-    df2 = df1 if sel_sys == "(All)" or "System" not in df1.columns else df1[df1["System"] == sel_sys]
-
-    # ---- Subsystem (depends on System) ----
-    sub_opts = ["(All)"] + (sorted(df2["Subsystem"].unique()) if "Subsystem" in df2.columns else [])
-    if st.session_state.get("subm_sub") not in sub_opts:
-        st.session_state["subm_sub"] = "(All)"
-    sel_sub = st.sidebar.selectbox(
-        "Subsystem",
-        sub_opts,
-        index=_safe_index(st.session_state.get("subm_sub", "(All)"), sub_opts),
-        key="subm_sub",
-    )
-
-    # -------- filtered data for chart/table --------
-    df_f = df2 if sel_sub == "(All)" or "Subsystem" not in df2.columns else df2[df2["Subsystem"] == sel_sub]
-
-    # ---------------- Main: single title + Clear (link) ----------------
-    c1, c2 = st.columns([8, 1])
-    with c1:
-        st.markdown('<div class="subm-title">Submittals</div>', unsafe_allow_html=True)
-    with c2:
-        if st.button("Clear", key="subm_clear_top", help="Reset all to (All)"):
-            st.session_state["reset_submittals"] = True
-            st.rerun()
-
-    # Show current Activity selection as a small pill ONLY when not "(All)"
-    current_act = st.session_state.get("activity_select", "(All)")
-    if current_act != "(All)":
-        st.markdown(f'<span class="subm-pill">{current_act}</span>', unsafe_allow_html=True)
-
-    # ---------------- Chart + Table ----------------
-    _sunburst_with_table_html(df_f, height=560)
-
-
-
-with tabs[12]:
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    reports_df = load_reports_df()
-    if reports_df is not None and not reports_df.empty:
-        # Optional filter by Activity at the very top  (default = "(All)")
-        if "Activity" in reports_df.columns:
-            acts_raw = sorted(reports_df["Activity"].dropna().astype(str).unique().tolist())
-            acts = ["(All)"] + acts_raw
-            if "activity_select" not in st.session_state:
-                st.session_state["activity_select"] = "(All)"
-            sel_act = st.selectbox("Activity", acts, key="activity_select")
-            df_act = reports_df if sel_act == "(All)" else reports_df[reports_df["Activity"] == sel_act]
-        else:
-            df_act = reports_df
-
-        build_submittals_plotly(df_act)
-
-    st.markdown("</div>", unsafe_allow_html=True)
+# -------------------- Active tab --------------------
+TABS = dict(zip(TAB_NAMES, [
+    tab_overview, tab_project_details, tab_milestones, tab_constraints, tab_achievements,
+    tab_recommendations, tab_ag_summary, tab_closeoutsoft_summary, tab_comparison,
+    tab_general_notes, tab_handover, tab_site_visits, tab_submittals,
+]))
+TABS[active_tab]()
+startup_profile.mark(f"tab: {active_tab}")
+startup_profile.end()
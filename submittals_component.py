@@ -0,0 +1,85 @@
+# Submittals sunburst + detail table as a bidirectional Streamlit component.
+# The frontend (frontend/submittals_sunburst: plain JS, no build step) stays mounted across
+# reruns and redraws with Plotly.react. The columnar payload (reports_data.submittals_payload)
+# is only sent when its version changes; other reruns pass just the version. Clicks come back
+# as {"node": id, "version": version}; a remounted frontend that lost its data asks for a
+# resend with {"missing": version}. The Submittals tab turns a click into its Discipline /
+# System / Subsystem selection (on_click + clicked_path), so the server-side filters follow
+# the chart. In cascade mode those selects live in the component and filter the shipped data
+# in the browser; clicks are not reported back either, so drilling down never reruns the script.
+
+import os
+import uuid
+from pathlib import Path
+
+import plotly
+import streamlit as st
+import streamlit.components.v1 as components
+
+import reports_data
+
+FRONTEND_DIR = Path(__file__).parent / "frontend" / "submittals_sunburst"
+DELIM = "|||"
+ROOT = "ROOT"
+# Default for the sidebar "Filter in chart" toggle
+CLIENT_CASCADE = os.environ.get("SUBMITTALS_CLIENT_CASCADE", "0") == "1"
+
+_sunburst = components.declare_component("submittals_sunburst", path=str(FRONTEND_DIR))
+# Plotly.js straight from the installed plotly package (pinned in requirements.txt), served by
+# Streamlit's component file route: no CDN fetch. That route only sends "Cache-Control: public"
+# (no max-age, no validator) and the static route serves .js as text/plain, so the frontend
+# keeps the bundle in Cache Storage under this versioned URL instead of relying on HTTP caching.
+_plotly_js = components.declare_component("plotly_js", path=str(Path(plotly.__file__).parent / "package_data"))
+
+
+def plotly_js_src() -> str:
+    # Relative to the component iframe (/component/<name>/index.html), so baseUrlPath just works.
+    return f"../{_plotly_js.name}/plotly.min.js?v={plotly.__version__}"
+
+
+def submittals_sunburst(df, *, version: str = "", height: int = 560, cascade: bool = False,
+                        reset: int = 0, key: str = "subm_sunburst", on_click=None):
+    """
+    Render the sunburst + table for df and return the clicked node id (None = root / nothing
+    clicked for this version, and always None in cascade mode). version must identify df's
+    content; without one the payload is rebuilt and re-sent on every run. A new reset value
+    clears the in-component cascade. on_click runs (as a widget callback, before the rerun)
+    when the component value changes; clicked_path() reads the click from there.
+    """
+    sent_key = f"_{key}_sent"
+    value = st.session_state.get(key) or {}
+    if not version:
+        version = uuid.uuid4().hex
+        payload = reports_data.encode_payload(reports_data.build_submittals_payload(df))
+    elif st.session_state.get(sent_key) != version or value.get("missing") == version:
+        payload = reports_data.submittals_payload(version, df)
+    else:
+        payload = None
+    if payload is not None:
+        st.session_state[sent_key] = version
+
+    value = _sunburst(
+        version=version,
+        payload=payload,
+        plotly_src=plotly_js_src(),
+        cascade=cascade,
+        report_clicks=not cascade,
+        reset=reset,
+        chart_height=height - 220,
+        table_height=340,
+        key=key,
+        default=None,
+        on_change=on_click,
+    ) or {}
+    node = value.get("node") if value.get("version") == version and not cascade else None
+    return None if node in (None, ROOT) else node
+
+
+def clicked_path(key: str = "subm_sunburst") -> "list | None":
+    # For on_click: the clicked node's labels ([] = root), or None when the new value is not a
+    # click on the data currently shown (resend requests, acks, stale versions).
+    value = st.session_state.get(key) or {}
+    node = value.get("node")
+    if not node or value.get("version") != st.session_state.get(f"_{key}_sent"):
+        return None
+    return [] if node == ROOT else node.split(DELIM)
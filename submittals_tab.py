@@ -0,0 +1,259 @@
+# Submittals tab: Reports loader (local file or upload), Activity filter, Discipline / System /
+# Subsystem cascade and the sunburst + detail table component. Imported when the tab first
+# renders, so reports_data (pyarrow) and the component load only for users who open it.
+
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+import reports_data
+import submittals_component
+import synthetic
+
+
+def _keep_upload():
+    st.session_state["reports_upload"] = st.session_state.get("reports_uploader")
+
+
+def _drop_upload():
+    st.session_state.pop("reports_upload", None)
+    st.session_state.pop("reports_upload_digest", None)
+
+
+def _upload_digest(uploaded) -> str:
+    # Content hash of the kept upload, computed once per upload (file_id) rather than per rerun.
+    kept = st.session_state.get("reports_upload_digest")
+    if kept is None or kept[0] != uploaded.file_id:
+        kept = (uploaded.file_id, reports_data.bytes_fingerprint(uploaded.getvalue()))
+        st.session_state["reports_upload_digest"] = kept
+    return kept[1]
+
+
+def load_reports_df() -> "reports_data.LoadedReports | None":
+    """
+    Load Reports.json / Reports.xlsx from the app folder OR from a user upload.
+    Parsing/mapping is cached process-wide in reports_data (keyed by path + size + mtime,
+    or by content hash for uploads), so reruns don't re-read the file. The returned
+    LoadedReports carries the frame (.df) and a stable .version for downstream caches.
+    With DEMO_SCALE set, a synthetic table of that many rows replaces the local file
+    (unless REPORTS_FILE names one explicitly).
+    """
+    # 1) Try local files (or the synthetic load-test table)
+    here = Path(__file__).parent if "__file__" in globals() else Path(".")
+    local = None if synthetic.DEMO_SCALE and not reports_data.REPORTS_FILE else reports_data.find_local_reports(here)
+    discovered = reports_data.LoadedReports(None, 0)
+    if local is not None:
+        try:
+            discovered = reports_data.load_reports_file(*reports_data.file_fingerprint(local))
+        except Exception as e:
+            st.warning(f"Found {local.name} but failed to read it: {e}")
+
+    # 2) Uploader (always visible). The upload itself lives in session state: the widget is
+    #    re-created empty after a visit to another tab, and only a user change replaces it.
+    st.file_uploader(
+        "Report Inputs",
+        type=["json", "xlsx"],
+        key="reports_uploader",
+        accept_multiple_files=False,
+        on_change=_keep_upload,
+        help="Upload Reports.json or Reports.xlsx. If present locally next to the app, it will be picked up automatically.",
+    )
+    uploaded = st.session_state.get("reports_upload")
+    if uploaded is not None and st.session_state.get("reports_uploader") is None:
+        # The remounted uploader is empty but the kept file still feeds the charts: name it and
+        # let the user drop it (back to the local file).
+        k1, k2 = st.columns([8, 1])
+        k1.caption(f"Using uploaded file **{uploaded.name}**")
+        k2.button("Remove", key="reports_upload_remove", help="Stop using the uploaded file", on_click=_drop_upload)
+
+    loaded, src = reports_data.LoadedReports(None, 0), None
+    if uploaded is not None:
+        try:
+            loaded = reports_data.load_reports_upload(uploaded.name, _upload_digest(uploaded), uploaded)
+            src = f"uploaded file ({uploaded.name})"
+        except Exception as e:
+            st.error(f"Could not read uploaded file: {e}")
+
+    if src is None and local is not None:
+        loaded, src = discovered, f"local file ({local.name})"
+    elif src is None and synthetic.DEMO_SCALE:
+        loaded = synthetic.demo_reports(synthetic.DEMO_SEED, synthetic.DEMO_SCALE)
+        src = f"synthetic ({synthetic.DEMO_SCALE} rows, seed {synthetic.DEMO_SEED})"
+    df, orig_len = loaded.df, loaded.rows_read
+
+    if df is None and orig_len == 0:
+        st.info("Place **Reports.json** or **Reports.xlsx** next to `streamlit_app.py`, or use the **Report Inputs** control above.")
+        return None
+
+    # Auto-map & validate (mapping itself ran inside the cached loader)
+    if df is None or df.empty:
+        st.error("Reports file loaded, but required columns not found. Expect **Discipline, System** (plus Subsystem/Status/Activity if available).")
+        return None
+
+    with st.expander("REPORTS DATA", expanded=False):
+        st.write(f"Source: **{src or 'unknown'}**")
+        st.write(f"Rows used for charts: **{len(df)}**  (from original **{orig_len}**)")
+        if len(df) > reports_data.DETAIL_ROWS:
+            st.caption(f"Chart counts use every row; the detail table receives at most {reports_data.DETAIL_ROWS} rows per view.")
+        st.write("Columns:", list(df.columns))
+        st.dataframe(
+            pd.DataFrame(
+                [(m.target, m.source, m.alias, "exact" if m.exact else "contains") for m in loaded.mapping],
+                columns=["Column", "Source column", "Alias", "Match"],
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.dataframe(df.head(20), use_container_width=True, hide_index=True)
+
+    return loaded
+
+
+# ----- Submittals: cascade selectboxes + sunburst/table component (submittals_component.py) -----
+def _reset_submittals():
+    # Clear (on_click): runs before the rerun, so the selectboxes are rebuilt at "(All)"
+    st.session_state.update({
+        "subm_disc": "(All)",
+        "subm_sys":  "(All)",
+        "subm_sub":  "(All)",
+        "subm_reset_count": st.session_state.get("subm_reset_count", 0) + 1,  # clears the in-chart cascade
+    })
+
+
+def _follow_click():
+    # Sunburst click (on_change, before the rerun): the clicked node becomes the cascade
+    # selection, so the selectboxes, the filtered rows and the payload follow the chart.
+    path = submittals_component.clicked_path()
+    if path is None:
+        return
+    path += ["(All)"] * (3 - len(path))
+    st.session_state.update({"subm_disc": path[0], "subm_sys": path[1], "subm_sub": path[2]})
+
+
+def build_submittals_plotly(df: pd.DataFrame, *, version: str = "", rows=None):
+    # Filled frame + Discipline/System/Subsystem index for df's rows (None = all), built once
+    # per dataset version.
+    if version:
+        df, tree = reports_data.submittals_hierarchy(version, df, rows)
+    else:
+        df, tree = reports_data.prepare_hierarchy(df if rows is None else df.take(rows))
+
+    # --- NEW: one-time init for this tab (enforce '(All)' on first load) ---
+    if "subm_initialized" not in st.session_state:
+        st.session_state["subm_disc"] = "(All)"
+        st.session_state["subm_sys"]  = "(All)"
+        st.session_state["subm_sub"]  = "(All)"
+        st.session_state["subm_initialized"] = True
+
+    # Minimal CSS for the title & activity pill
+    st.markdown("""
+    <style>
+      .subm-title{font-size:16px;font-weight:700;margin:0;}
+      .subm-pill{
+        display:inline-block;margin:6px 0 10px 0;padding:4px 10px;font-size:12px;
+        background:#EEF2F7;color:#0F172A;border:1px solid #E6ECF4;border-radius:9999px;
+      }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # ---- helper ----
+    def _sel(val): return None if val == "(All)" else val
+
+    # ---------------- Main: single title + Clear (link) ----------------
+    c1, c2 = st.columns([8, 1])
+    with c1:
+        st.markdown('<div class="subm-title">Submittals</div>', unsafe_allow_html=True)
+    with c2:
+        st.button("Clear", key="subm_clear_top", help="Reset all to (All)", on_click=_reset_submittals)
+
+    # Show current Activity selection as a small pill ONLY when not "(All)"
+    current_act = st.session_state.get("activity_select", "(All)")
+    if current_act != "(All)":
+        st.markdown(f'<span class="subm-pill">{current_act}</span>', unsafe_allow_html=True)
+
+    # ---------------- Cascade (in the tab, so the whole section is one fragment) ----------------
+    # The keyed widgets below take their values from session state only (no index= / value=):
+    # the app re-assigns these keys on every full run, and a widget default on top of that
+    # makes Streamlit warn about the value being set twice.
+    st.session_state.setdefault("subm_client_cascade", submittals_component.CLIENT_CASCADE)
+    f1, f2, f3, f4 = st.columns([3, 3, 3, 2])
+    with f4:
+        # In-chart cascade: the three selects run inside the component, in the browser
+        client_cascade = st.toggle(
+            "Filter in chart",
+            key="subm_client_cascade",
+            help="Discipline / System / Subsystem filtering runs in the browser, without reruns",
+        )
+
+    if client_cascade:
+        sel_disc = sel_sys = sel_sub = "(All)"
+    else:
+        # ---- Discipline ----
+        disc_opts = ["(All)"] + reports_data.hierarchy_options(tree, [])
+        if st.session_state.get("subm_disc") not in disc_opts:
+            st.session_state["subm_disc"] = "(All)"
+        sel_disc = f1.selectbox(
+            "Discipline",
+            disc_opts,
+            key="subm_disc",
+        )
+
+        # ---- System (depends on Discipline) ----
+        sys_opts = ["(All)"] + reports_data.hierarchy_options(tree, [_sel(sel_disc)])
+        if st.session_state.get("subm_sys") not in sys_opts:
+            st.session_state["subm_sys"] = "(All)"
+        sel_sys = f2.selectbox(
+            "System",
+            sys_opts,
+            key="subm_sys",
+        )
+
+        # ---- Subsystem (depends on System) ----
+        sub_opts = ["(All)"] + reports_data.hierarchy_options(tree, [_sel(sel_disc), _sel(sel_sys)])
+        if st.session_state.get("subm_sub") not in sub_opts:
+            st.session_state["subm_sub"] = "(All)"
+        sel_sub = f3.selectbox(
+            "Subsystem",
+            sub_opts,
+            key="subm_sub",
+        )
+
+    # -------- filtered data for chart/table --------
+    rows = reports_data.hierarchy_rows(tree, [_sel(sel_disc), _sel(sel_sys), _sel(sel_sub)])
+    df_f = df if rows is None else df.take(rows)
+
+    # ---------------- Chart + Table ----------------
+    # Declared component: stays mounted, data only re-sent when this version changes.
+    node_version = f"{version}|{sel_disc}|{sel_sys}|{sel_sub}" if version else ""
+    # Clicks reach the server through on_click (_follow_click), not the return value.
+    submittals_component.submittals_sunburst(
+        df_f, version=node_version, height=560,
+        cascade=client_cascade, reset=st.session_state.get("subm_reset_count", 0),
+        on_click=_follow_click,
+    )
+
+
+@st.fragment
+def render():
+    # Fragment: the uploader, Activity, cascade, Clear and chart clicks rerun only this function,
+    # not the KPI cards and the other tabs.
+    st.markdown('<div class="card">', unsafe_allow_html=True)
+    loaded = load_reports_df()
+    reports_df = loaded.df if loaded is not None else None
+    if reports_df is not None and not reports_df.empty:
+        # Optional filter by Activity at the very top  (default = "(All)")
+        if "Activity" in reports_df.columns:
+            act_rows = reports_data.activity_rows(loaded.version, reports_df)
+            acts = ["(All)"] + list(act_rows)
+            if "activity_select" not in st.session_state:
+                st.session_state["activity_select"] = "(All)"
+            sel_act = st.selectbox("Activity", acts, key="activity_select")
+            rows = act_rows.get(sel_act)  # None for "(All)"
+            version = f"{loaded.version}|Activity={sel_act}"
+        else:
+            rows, version = None, loaded.version
+
+        build_submittals_plotly(reports_df, version=version, rows=rows)
+
+    st.markdown("</div>", unsafe_allow_html=True)
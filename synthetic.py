@@ -0,0 +1,164 @@
+# Synthetic demo data: the five registers (materials, drawings, NCR, WIR, method statements)
+# and a Reports-shaped submittal table, generated column-wise from one np.random.Generator.
+# Cached per (seed, scale), so the demo costs nothing per rerun. scale=None gives the
+# dashboard's demo sizes; DEMO_SCALE=1e6 (1k .. 10M) makes every register and the Submittals
+# table that many rows, for load-testing the real filter / cube / payload paths.
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+DEMO_SEED = int(os.environ.get("DEMO_SEED", "1"))
+DEMO_SCALE = int(float(os.environ["DEMO_SCALE"])) if os.environ.get("DEMO_SCALE") else None
+
+DISCIPLINES = ["Architectural", "Civil", "Controls", "ELV", "Electrical"]
+SOURCES = ["AG", "CloseoutSoft"]
+REGISTER_NAMES = ("materials", "drawings", "ncrs", "wir", "ms")
+DEMO_ROWS = {"materials": 225, "drawings": 200, "ncrs": 150, "wir": 160, "ms": 120}
+
+
+def _cat(rng, values, n, p=None) -> pd.Categorical:
+    # values sorted, like the loader's category dictionaries
+    return pd.Categorical.from_codes(rng.choice(len(values), n, p=p), values)
+
+
+def _grid(n: int, start: str, periods: int, freq: str):
+    # Discipline-major Discipline x date grid (wrapping past one full grid).
+    i = np.arange(n)
+    dates = pd.date_range(start, periods=periods, freq=freq)
+    return pd.Categorical.from_codes((i // periods) % len(DISCIPLINES), DISCIPLINES), dates[i % periods]
+
+
+def _dates(rng, n: int, start: str, periods: int, freq: str = "D") -> pd.DatetimeIndex:
+    return pd.date_range(start, periods=periods, freq=freq)[rng.integers(0, periods, n)]
+
+
+# -------------------- Registers --------------------
+def materials(rng, n: int) -> pd.DataFrame:
+    disc, dates = _grid(n, "2025-02-01", 45, "2D")
+    total = rng.integers(2, 16, n)
+    ap = np.maximum(0, total - rng.integers(0, 4, n))
+    rj = rng.integers(0, np.minimum(3, total - ap) + 1)
+    ur = np.maximum(0, total - ap - rj)
+    return pd.DataFrame({"Date": dates, "Discipline": disc, "Submitted": total, "Approved": ap,
+                         "Rejected": rj, "UR": ur, "Source": _cat(rng, SOURCES, n)})
+
+
+def drawings(rng, n: int) -> pd.DataFrame:
+    disc, dates = _grid(n, "2025-02-01", 40, "3D")
+    total = rng.integers(1, 12, n)
+    ap = np.maximum(0, total - rng.integers(0, 3, n))
+    ac = rng.integers(0, np.minimum(3, total - ap) + 1)
+    rj = rng.integers(0, np.minimum(2, total - ap - ac) + 1)
+    ur = np.maximum(0, total - ap - ac - rj)
+    return pd.DataFrame({"Date": dates, "Discipline": disc, "Submitted": total, "Approved": ap,
+                         "ApprovedWithComments": ac, "Rejected": rj, "UR": ur,
+                         "Source": _cat(rng, SOURCES, n)})
+
+
+def ncrs(rng, n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": _dates(rng, n, "2025-02-01", 70),
+        "Discipline": _cat(rng, DISCIPLINES, n),
+        "Status": _cat(rng, ["Closed", "Open"], n, p=[0.55, 0.45]),
+        "Severity": _cat(rng, ["High", "Low", "Medium"], n, p=[0.15, 0.4, 0.45]),
+        "Source": _cat(rng, SOURCES, n),
+    })
+
+
+def wir(rng, n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": _dates(rng, n, "2025-02-01", 90),
+        "Discipline": _cat(rng, DISCIPLINES, n),
+        "Approved": rng.choice([0, 1], n, p=[0.1, 0.9]),
+        "Source": _cat(rng, SOURCES, n),
+    })
+
+
+def ms(rng, n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": _dates(rng, n, "2025-02-01", 60, "2D"),
+        "Discipline": _cat(rng, DISCIPLINES, n),
+        "Submitted": rng.integers(0, 6, n),
+        "Approved": rng.integers(0, 6, n),
+        "Rejected": rng.integers(0, 3, n),
+        "UR": rng.integers(0, 3, n),
+        "Source": _cat(rng, SOURCES, n),
+    })
+
+
+GENERATORS = {"materials": materials, "drawings": drawings, "ncrs": ncrs, "wir": wir, "ms": ms}
+
+
+def build_registers(seed: int, scale: "int | None" = None) -> dict:
+    # One child stream per register: a register's rows don't depend on the others' sizes.
+    streams = np.random.SeedSequence(seed).spawn(len(REGISTER_NAMES))
+    return {
+        name: GENERATORS[name](np.random.default_rng(s), scale or DEMO_ROWS[name])
+        for name, s in zip(REGISTER_NAMES, streams)
+    }
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def demo_registers(seed: int, scale: "int | None" = None) -> dict:
+    # Shared across sessions: never mutate the frames.
+    return build_registers(seed, scale)
+
+
+def register_version(name: str, seed: int, scale: "int | None" = None) -> str:
+    # Content version for the per-register caches (filter index, KPI cube, group sums).
+    return f"synthetic:{name}:{seed}:{scale or 'demo'}"
+
+
+# -------------------- Reports-shaped submittals --------------------
+# Discipline / System / Subsystem taxonomy with roughly the shape of a real Reports export:
+# 5 disciplines, ~60 systems, ~230 subsystems, skewed (Zipf-like) row counts per leaf and
+# ~1.5% of rows without a System / Subsystem.
+REPORT_DISCIPLINES = {"Architectural": "ARC", "Electrical": "ELE", "MEP": "MEP", "Mechanical": "MEC", "Structural": "STR"}
+REPORT_STATUS = {"A": 0.84, "B": 0.115, "C": 0.015, "D": 0.029, "E": 0.001}
+REPORT_ACTIVITY = {"MIR": 0.19, "MS": 0.035, "SD": 0.08, "TS": 0.058, "WIR": 0.637}
+REPORT_LEVELS = ["Basement Floor", "First Floor", "Foundation", "Ground Floor", "Mezzanine", "Roof Floor"]
+
+
+def _taxonomy(rng) -> pd.DataFrame:
+    # One row per leaf: Discipline, System, Subsystem labels.
+    leaves = []
+    for disc, code in REPORT_DISCIPLINES.items():
+        for s in range(int(rng.integers(8, 17))):
+            system = f"{code}-{s + 1:02d}"
+            leaves += [(disc, system, f"{system}.{k + 1}") for k in range(int(rng.integers(1, 8)))]
+    return pd.DataFrame(leaves, columns=["Discipline", "System", "Subsystem"])
+
+
+def reports_frame(rng, n: int) -> pd.DataFrame:
+    tax = _taxonomy(rng)
+    weights = 1.0 / np.arange(1, len(tax) + 1) ** 1.1
+    leaf = rng.choice(len(tax), n, p=rng.permutation(weights / weights.sum()))
+    missing = rng.random(n) < 0.015
+    dims = {}
+    for c in ["Discipline", "System", "Subsystem"]:
+        codes, labels = pd.factorize(tax[c], sort=True)
+        codes = codes[leaf] if c == "Discipline" else np.where(missing, -1, codes[leaf])
+        dims[c] = pd.Categorical.from_codes(codes, labels)
+    level = rng.integers(-len(REPORT_LEVELS) * 15, len(REPORT_LEVELS), n)  # ~93% without a Level
+    return pd.DataFrame({
+        **dims,
+        "Status": _cat(rng, list(REPORT_STATUS), n, p=list(REPORT_STATUS.values())),
+        "Activity": _cat(rng, list(REPORT_ACTIVITY), n, p=list(REPORT_ACTIVITY.values())),
+        "SubmittalDate": pd.Timestamp("2018-01-01") + pd.to_timedelta(rng.integers(0, 2770, n), unit="D"),
+        "InternalRefNumber": "SUB-" + pd.Index(np.arange(1, n + 1)).astype(str),
+        "Company": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ["Global Admin"]),
+        "Building": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ["Synthetic Plant"]),
+        "Level": pd.Categorical.from_codes(np.where(level < 0, -1, level), REPORT_LEVELS),
+    })
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def demo_reports(seed: int, scale: int):
+    # A LoadedReports as the Submittals tab gets from a file (normalized, stable version).
+    import reports_data
+
+    df = reports_frame(np.random.default_rng(np.random.SeedSequence([seed, 1])), scale)
+    return reports_data.normalize_reports(df)._replace(version=f"synthetic:reports:{seed}:{scale}")